@@ -6,39 +6,322 @@ monitoring, and maintenance capabilities.
 """
 
 import os
+import re
 import sys
 import json
-import yaml
 import subprocess
 import shutil
 import time
+import configparser
 import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import argparse
 import logging
-from dataclasses import dataclass, asdict
-import psutil
-import requests
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Prompt, Confirm
-from rich import print as rprint
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('project_manager.log'),
-        logging.StreamHandler()
-    ]
-)
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from dataclasses import dataclass, asdict, replace
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+
+# Directories that are never worth descending into when walking a project
+PRUNE_DIRS = frozenset({
+    'node_modules', '.git', '__pycache__', '.venv', 'venv', 'dist', 'build',
+    '.pytest_cache', '.mypy_cache'
+})
+
+
+# Top-level directory names that count as tests / documentation
+TEST_DIRS = frozenset({'tests', 'test', '__tests__', 'spec'})
+DOC_DIRS = frozenset({'docs', 'documentation', 'doc'})
+
+# Marker files checked in order by detect_project_type
+PROJECT_TYPE_MARKERS = {
+    'package.json': ('nodejs', 'javascript', 'node'),
+    'requirements.txt': ('python', 'python', 'flask'),
+    'Cargo.toml': ('rust', 'rust', 'cargo'),
+    'go.mod': ('go', 'go', 'go'),
+    'pom.xml': ('java', 'java', 'maven'),
+    'composer.json': ('php', 'php', 'composer'),
+    'Gemfile': ('ruby', 'ruby', 'bundler'),
+    'Dockerfile': ('docker', 'docker', 'docker'),
+    'docker-compose.yml': ('docker', 'docker', 'docker-compose'),
+    'Makefile': ('c', 'c', 'make'),
+    'CMakeLists.txt': ('cpp', 'cpp', 'cmake')
+}
+
+# Files an analysis reads; editing one in place leaves the directory mtime alone,
+# so their mtimes are part of a cache entry's stamp
+_CACHE_KEY_FILES = frozenset({
+    'package.json', 'requirements.txt', 'Cargo.toml', 'go.mod', 'pom.xml',
+    'composer.json', 'Gemfile', 'setup.py', 'pyproject.toml', 'README.md'
+})
+
+# Bump when the layout of the analysis cache file changes
+CACHE_VERSION = 2
+
+# How many dependencies get_dependencies reports, and the package name at the
+# start of a requirements line (version specifiers, extras and markers are dropped)
+MAX_DEPENDENCIES = 10
+_REQUIREMENT_RE = re.compile(rb'^\s*([A-Za-z0-9][A-Za-z0-9_.\-]*)')
+
+
+# macOS and Windows filesystems match names regardless of case by default
+CASE_INSENSITIVE_FS = sys.platform in ('darwin', 'win32')
+
+
+class FoldedNames(frozenset):
+    """Entry names whose membership checks ignore case, like Path.exists() on a case-insensitive filesystem"""
+    __slots__ = ('_folded',)
+    
+    def __new__(cls, names):
+        self = super().__new__(cls, names)
+        self._folded = frozenset(name.casefold() for name in self)
+        return self
+    
+    def __contains__(self, name):
+        return name.casefold() in self._folded
+    
+    def isdisjoint(self, other):
+        return self._folded.isdisjoint(name.casefold() for name in other)
+    
+    def __and__(self, other):
+        # Keep the caller's spellings so exact-case lookups on the result still match
+        return frozenset(name for name in other if name in self)
+
+
+def _entry_names(names):
+    """Wrap directory entry names so lookups follow the platform's filesystem case rules"""
+    return FoldedNames(names) if CASE_INSENSITIVE_FS else names
+
+
+def _list_top_level(path) -> set:
+    """Return the names of the entries directly inside path"""
+    try:
+        with os.scandir(path) as entries:
+            return _entry_names({entry.name for entry in entries})
+    except (PermissionError, FileNotFoundError, NotADirectoryError):
+        return set()
+
+
+def _key_files_mtime_ns(path) -> int:
+    """Newest mtime_ns among a project's key files and its git config, read off one scandir pass"""
+    key_mtime_ns = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                if entry.name in _CACHE_KEY_FILES:
+                    key_mtime_ns = max(key_mtime_ns, entry.stat().st_mtime_ns)
+                elif entry.name == '.git' and entry.is_dir():
+                    # git remote set-url rewrites .git/config
+                    key_mtime_ns = max(key_mtime_ns, os.stat(os.path.join(entry.path, 'config')).st_mtime_ns)
+            except OSError:  # dangling symlink, missing config or removed mid-scan
+                continue
+    return key_mtime_ns
+
+
+def _scandir_files(path, prune=PRUNE_DIRS):
+    """Yield file entries under path using os.scandir, skipping pruned directories"""
+    # An explicit stack avoids the per-level cost of chained generators
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file(follow_symlinks=False):
+                            yield entry
+                        elif entry.is_dir(follow_symlinks=False) and entry.name not in prune:
+                            stack.append(entry.path)
+                    except (PermissionError, FileNotFoundError):
+                        continue
+        except (PermissionError, FileNotFoundError, NotADirectoryError):
+            continue
+
+
+def _walk_accumulate(path, prune=PRUNE_DIRS, large_file_threshold=10 * 1024 * 1024) -> Tuple[int, List[str], set]:
+    """Walk a tree once, returning (total_size, large_file_names, top_level_names)"""
+    total_size = 0
+    large_files = []
+    top_level = set()
+    stack = [path]
+    is_root = True
+    
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if is_root:
+                        top_level.add(name)
+                    try:
+                        if entry.is_file(follow_symlinks=False):
+                            file_size = entry.stat(follow_symlinks=False).st_size
+                            total_size += file_size
+                            if file_size > large_file_threshold:
+                                large_files.append(name)
+                        elif entry.is_dir(follow_symlinks=False) and name not in prune:
+                            stack.append(entry.path)
+                    except (PermissionError, FileNotFoundError):
+                        continue
+        except (PermissionError, FileNotFoundError, NotADirectoryError):
+            pass
+        is_root = False
+    
+    return total_size, large_files, _entry_names(top_level)
+
+# Buffer for file copies that can't use a kernel copy path
+COPY_BUFSIZE = 4 * 1024 * 1024
+
+
+def _fast_copy(src, dst, *, follow_symlinks=True):
+    """copy2 replacement for copytree that moves data in large chunks"""
+    if sys.platform.startswith('linux') or sys.platform == 'darwin':
+        # shutil already hands whole files to sendfile / fcopyfile here
+        return shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        shutil.copyfileobj(fsrc, fdst, length=COPY_BUFSIZE)
+    shutil.copystat(src, dst, follow_symlinks=follow_symlinks)
+    return dst
+
+# Templates for files written by create_basic_files and the language helpers
+_README_TMPL = """# {name}
+
+## Description
+{name} project
+
+## Setup
+```bash
+# Install dependencies
+# Add setup instructions here
+
+# Run the project
+# Add run instructions here
+```
+
+## Development
+```bash
+# Development commands
+# Add development instructions here
+```
+"""
+
+_GITIGNORE_TMPL = b"""# Dependencies
+node_modules/
+__pycache__/
+*.pyc
+*.pyo
+*.pyd
+.Python
+env/
+venv/
+.venv/
+
+# IDE
+.vscode/
+.idea/
+*.swp
+*.swo
+
+# OS
+.DS_Store
+Thumbs.db
+
+# Logs
+*.log
+logs/
+
+# Environment
+.env
+.env.local
+.env.development.local
+.env.test.local
+.env.production.local
+
+# Build
+dist/
+build/
+*.egg-info/
+"""
+
+_MAIN_PY_TMPL = """#!/usr/bin/env python3
+\"\"\"
+{name} - Main module
+\"\"\"
+
+def main():
+    print("Hello from {name}!")
+
+if __name__ == "__main__":
+    main()
+"""
+
+_SETUP_PY_TMPL = """from setuptools import setup, find_packages
+
+setup(
+    name="{name}",
+    version="0.1.0",
+    description="A Python project",
+    author="Your Name",
+    author_email="your.email@example.com",
+    packages=find_packages(),
+    install_requires=[],
+    python_requires=">=3.7",
+)
+"""
+
+_INDEX_JS_TMPL = """// {name} - Main entry point
+
+console.log('Hello from {name}!');
+
+// Add your code here
+"""
+
+_CARGO_TOML_TMPL = """[package]
+name = "{name}"
+version = "0.1.0"
+edition = "2021"
+
+[dependencies]
+"""
+
+_MAIN_RS_TMPL = """fn main() {{
+    println!("Hello from {name}!");
+}}
+"""
+
+def _health_cell(health_score: int) -> str:
+    """Format a health score as a colour-coded rich markup cell"""
+    health_color = "green" if health_score >= 80 else "yellow" if health_score >= 60 else "red"
+    return f"[{health_color}]{health_score}%[/{health_color}]"
+
+# __slots__ on dataclasses needs Python 3.10; older interpreters just skip it
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Project:
     name: str
     path: str
@@ -48,31 +331,43 @@ class Project:
     status: str
     last_modified: str
     size: str
-    dependencies: List[str]
+    dependencies: Tuple[str, ...]
     git_remote: Optional[str]
     health_score: int
-    issues: List[str]
+    issues: Tuple[str, ...]
     notes: str
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ProjectTemplate:
     name: str
     type: str
     language: str
     framework: str
-    setup_commands: List[str]
-    dependencies: List[str]
+    setup_commands: Tuple[str, ...]
+    dependencies: Tuple[str, ...]
     config_files: Dict[str, str]
     description: str
 
 class ProjectManager:
     def __init__(self, config_path: str = "config.json"):
         self.config_path = config_path
-        self.console = Console()
+        # rich is imported lazily to keep CLI startup fast
+        from rich.console import Console
+        # Markup is explicit, so skip rich's per-cell highlighting regexes
+        self.console = Console(highlight=False)
         self.projects = []
+        self._project_by_name: Dict[str, Project] = {}
         self.templates = []
         self.config = self.load_config()
         self.setup_directories()
+        self.prune_dirs = frozenset(self.config.get("scan", {}).get("prune_dirs", PRUNE_DIRS))
+        # Changes below the top level don't show up in the stamp, so entries also expire
+        self.cache_ttl = self.config.get("scan", {}).get("cache_ttl", 300)
+        
+        # Analysis cache keyed by project path -> (directory mtime_ns, key-file mtime_ns, analyzed at, Project)
+        self.cache_path = os.path.expanduser("~/.project_manager_cache.json")
+        self._analysis_cache: Dict[str, Tuple[int, int, float, Project]] = self.load_cache()
+        self._cache_dirty = False
         
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file or create default"""
@@ -93,14 +388,19 @@ class ProjectManager:
             "backup": {
                 "enabled": True,
                 "frequency": "daily",
-                "retention_days": 30
+                "retention_days": 30,
+                "mode": "reflink"
+            },
+            "scan": {
+                "prune_dirs": sorted(PRUNE_DIRS),
+                "cache_ttl": 300
             }
         }
         
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, 'r') as f:
-                    config = json.load(f)
+                with open(self.config_path, 'rb') as f:
+                    config = _json_loads(f.read())
                 # Merge with defaults
                 for key, value in default_config.items():
                     if key not in config:
@@ -118,11 +418,53 @@ class ProjectManager:
         if config is None:
             config = self.config
         try:
-            with open(self.config_path, 'w') as f:
-                json.dump(config, f, indent=2)
+            with open(self.config_path, 'wb') as f:
+                f.write(_json_dumps(config, indent=True))
         except Exception as e:
             logger.error(f"Error saving config: {e}")
     
+    def load_cache(self) -> Dict[str, Tuple[int, int, float, Project]]:
+        """Load cached project analyses from disk"""
+        cache = {}
+        if os.path.exists(self.cache_path):
+            try:
+                with open(self.cache_path, 'rb') as f:
+                    data = _json_loads(f.read())
+                # Sizes and markers depend on what the walk pruned, so a different prune set starts over
+                if (not isinstance(data, dict) or data.get('version') != CACHE_VERSION
+                        or frozenset(data.get('prune_dirs', ())) != self.prune_dirs):
+                    return cache
+                for path, entry in data['projects'].items():
+                    fields = entry['project']
+                    # JSON hands the tuple fields back as lists
+                    fields['dependencies'] = tuple(fields['dependencies'])
+                    fields['issues'] = tuple(fields['issues'])
+                    cache[path] = (entry['mtime_ns'], entry['key_mtime_ns'], entry['analyzed_at'], Project(**fields))
+            except Exception as e:
+                logger.error(f"Error loading cache: {e}")
+        return cache
+    
+    def save_cache(self):
+        """Save cached project analyses to disk"""
+        data = {
+            'version': CACHE_VERSION,
+            'prune_dirs': sorted(self.prune_dirs),
+            'projects': {
+                path: {'mtime_ns': mtime_ns, 'key_mtime_ns': key_mtime_ns,
+                       'analyzed_at': analyzed_at, 'project': asdict(project)}
+                for path, (mtime_ns, key_mtime_ns, analyzed_at, project) in self._analysis_cache.items()
+            }
+        }
+        tmp_path = f"{self.cache_path}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(_json_dumps(data))
+            # Readers never see a half-written cache
+            os.replace(tmp_path, self.cache_path)
+            self._cache_dirty = False
+        except Exception as e:
+            logger.error(f"Error saving cache: {e}")
+    
     def setup_directories(self):
         """Create necessary directories"""
         dirs = [
@@ -141,32 +483,64 @@ class ProjectManager:
         if not projects_dir.exists():
             return projects
         
-        for project_path in projects_dir.iterdir():
-            if project_path.is_dir():
+        project_paths = [p for p in projects_dir.iterdir() if p.is_dir()]
+        
+        # One clock reading keeps every project's status consistent for this scan
+        now = time.time()
+        
+        # Analysis is dominated by filesystem I/O, so threads overlap well
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(project_path, executor.submit(self.analyze_project, project_path, now))
+                       for project_path in project_paths]
+            for project_path, future in futures:
                 try:
-                    project = self.analyze_project(project_path)
+                    project = future.result()
                     if project:
                         projects.append(project)
                 except Exception as e:
                     logger.error(f"Error analyzing project {project_path}: {e}")
         
+        if self._cache_dirty:
+            self.save_cache()
+        
         self.projects = projects
+        self._project_by_name = {project.name: project for project in projects}
         return projects
     
-    def analyze_project(self, project_path: Path) -> Optional[Project]:
+    def _get_project(self, name: str) -> Optional[Project]:
+        """Look up a project by name, rescanning only if it isn't known or has moved"""
+        project = self._project_by_name.get(name)
+        if project is None or not os.path.exists(project.path):
+            self.scan_projects()
+            project = self._project_by_name.get(name)
+        return project
+    
+    def analyze_project(self, project_path: Path, now: Optional[float] = None) -> Optional[Project]:
         """Analyze a project directory and extract information"""
         try:
             # Basic project info
             name = project_path.name
             path = str(project_path)
             
+            # Reuse the cached analysis if neither the directory nor its key files have changed
+            stat = project_path.stat()
+            key_mtime_ns = _key_files_mtime_ns(project_path)
+            analyzed_at = time.time() if now is None else now
+            cached = self._analysis_cache.get(path)
+            if (cached and cached[0] == stat.st_mtime_ns and cached[1] == key_mtime_ns
+                    and analyzed_at - cached[2] < self.cache_ttl):
+                return replace(cached[3], status=self.get_project_status(stat, now))
+            
+            # Walk the tree once and share the results with the checks below
+            stats = self._collect_project_stats(project_path)
+            
             # Detect project type and language
-            project_type, language, framework = self.detect_project_type(project_path)
+            project_type, language, framework = self.detect_project_type(project_path, stats['top_level'])
             
             # Get file stats
-            stat = project_path.stat()
             last_modified = datetime.datetime.fromtimestamp(stat.st_mtime).isoformat()
-            size = self.get_directory_size(project_path)
+            size = self._format_size(stats['total_size'])
             
             # Check git status
             git_remote = self.get_git_remote(project_path)
@@ -175,15 +549,15 @@ class ProjectManager:
             dependencies = self.get_dependencies(project_path, language)
             
             # Calculate health score
-            health_score = self.calculate_health_score(project_path, language)
+            health_score = self.calculate_health_score(project_path, language, stats)
             
             # Check for issues
-            issues = self.check_project_issues(project_path, language)
+            issues = self.check_project_issues(project_path, language, stats)
             
             # Get project status
-            status = self.get_project_status(project_path)
+            status = self.get_project_status(stat, now)
             
-            return Project(
+            project = Project(
                 name=name,
                 path=path,
                 type=project_type,
@@ -192,39 +566,32 @@ class ProjectManager:
                 status=status,
                 last_modified=last_modified,
                 size=size,
-                dependencies=dependencies,
+                dependencies=tuple(dependencies),
                 git_remote=git_remote,
                 health_score=health_score,
-                issues=issues,
+                issues=tuple(issues),
                 notes=""
             )
+            
+            self._analysis_cache[path] = (stat.st_mtime_ns, key_mtime_ns, analyzed_at, project)
+            self._cache_dirty = True
+            return project
         except Exception as e:
             logger.error(f"Error analyzing project {project_path}: {e}")
             return None
     
-    def detect_project_type(self, project_path: Path) -> tuple:
+    def detect_project_type(self, project_path: Path, top_level: Optional[set] = None) -> tuple:
         """Detect project type, language, and framework"""
-        # Check for common files
-        files_to_check = {
-            'package.json': ('nodejs', 'javascript', 'node'),
-            'requirements.txt': ('python', 'python', 'flask'),
-            'Cargo.toml': ('rust', 'rust', 'cargo'),
-            'go.mod': ('go', 'go', 'go'),
-            'pom.xml': ('java', 'java', 'maven'),
-            'composer.json': ('php', 'php', 'composer'),
-            'Gemfile': ('ruby', 'ruby', 'bundler'),
-            'Dockerfile': ('docker', 'docker', 'docker'),
-            'docker-compose.yml': ('docker', 'docker', 'docker-compose'),
-            'Makefile': ('c', 'c', 'make'),
-            'CMakeLists.txt': ('cpp', 'cpp', 'cmake')
-        }
+        # One directory listing answers every marker check
+        if top_level is None:
+            top_level = _list_top_level(project_path)
         
-        for file_name, (project_type, language, framework) in files_to_check.items():
-            if (project_path / file_name).exists():
+        for file_name, (project_type, language, framework) in PROJECT_TYPE_MARKERS.items():
+            if file_name in top_level:
                 return project_type, language, framework
         
         # Check for common directories
-        if (project_path / 'src').exists():
+        if 'src' in top_level:
             return 'generic', 'unknown', 'unknown'
         
         return 'unknown', 'unknown', 'unknown'
@@ -232,19 +599,47 @@ class ProjectManager:
     def get_directory_size(self, path: Path) -> str:
         """Get human-readable directory size"""
         total_size = 0
-        for file_path in path.rglob('*'):
-            if file_path.is_file():
-                total_size += file_path.stat().st_size
+        for entry in _scandir_files(path, self.prune_dirs):
+            try:
+                total_size += entry.stat(follow_symlinks=False).st_size
+            except (PermissionError, FileNotFoundError):
+                continue
         
-        # Convert to human readable
+        return self._format_size(total_size)
+    
+    def _format_size(self, total_size: float) -> str:
+        """Convert a size in bytes to human readable form"""
         for unit in ['B', 'KB', 'MB', 'GB']:
             if total_size < 1024.0:
                 return f"{total_size:.1f} {unit}"
             total_size /= 1024.0
         return f"{total_size:.1f} TB"
     
+    def _collect_project_stats(self, project_path: Path) -> Dict[str, Any]:
+        """Walk a project tree once and collect size, large files and top-level markers"""
+        total_size, large_files, top_level = _walk_accumulate(project_path, self.prune_dirs)
+        
+        return {
+            'total_size': total_size,
+            'large_files': large_files,
+            'top_level': top_level,
+            'has_readme': 'README.md' in top_level,
+            'has_gitignore': '.gitignore' in top_level,
+            'has_tests': not top_level.isdisjoint(TEST_DIRS),
+            'has_docs': not top_level.isdisjoint(DOC_DIRS),
+            'has_node_modules': 'node_modules' in top_level,
+            'has_git': '.git' in top_level,
+            'cache_dirs_present': [d for d in ('__pycache__', '.pytest_cache') if d in top_level]
+        }
+    
     def get_git_remote(self, project_path: Path) -> Optional[str]:
         """Get git remote URL"""
+        try:
+            return self._read_git_remote(project_path)
+        except Exception:
+            pass
+        
+        # Fall back to asking git when the config can't be parsed directly
         try:
             result = subprocess.run(
                 ['git', 'remote', 'get-url', 'origin'],
@@ -258,104 +653,120 @@ class ProjectManager:
             pass
         return None
     
+    def _read_git_remote(self, project_path: Path) -> Optional[str]:
+        """Read the origin URL straight from .git/config without spawning git"""
+        git_dir = project_path / '.git'
+        if git_dir.is_file():
+            # Worktrees and submodules use a "gitdir: <path>" pointer file
+            with open(git_dir) as f:
+                pointer = f.read().strip()
+            if not pointer.startswith('gitdir:'):
+                raise ValueError(f"Unrecognised .git file in {project_path}")
+            git_dir = (project_path / pointer[len('gitdir:'):].strip()).resolve()
+        elif not git_dir.is_dir():
+            return None
+        
+        config_file = git_dir / 'config'
+        if not config_file.exists():
+            # Linked worktrees keep the shared config in the common dir
+            commondir_file = git_dir / 'commondir'
+            if not commondir_file.exists():
+                raise FileNotFoundError(f"No git config found for {project_path}")
+            with open(commondir_file) as f:
+                config_file = (git_dir / f.read().strip()).resolve() / 'config'
+        
+        parser = configparser.ConfigParser(strict=False, interpolation=None)
+        parser.read(config_file)
+        return parser.get('remote "origin"', 'url', fallback=None)
+    
     def get_dependencies(self, project_path: Path, language: str) -> List[str]:
         """Get project dependencies based on language"""
         dependencies = []
         
         if language == 'javascript':
-            package_json = project_path / 'package.json'
-            if package_json.exists():
-                try:
-                    with open(package_json) as f:
-                        data = json.load(f)
-                    dependencies = list(data.get('dependencies', {}).keys())
-                except Exception:
-                    pass
+            try:
+                data = _json_loads((project_path / 'package.json').read_bytes())
+                dependencies = list(islice(data.get('dependencies', {}), MAX_DEPENDENCIES))
+            except Exception:
+                pass
         
         elif language == 'python':
-            requirements_txt = project_path / 'requirements.txt'
-            if requirements_txt.exists():
-                try:
-                    with open(requirements_txt) as f:
-                        dependencies = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-                except Exception:
-                    pass
+            try:
+                # Stop reading as soon as enough names are found; pip freeze output can be huge
+                with open(project_path / 'requirements.txt', 'rb') as f:
+                    for line in f:
+                        if line.startswith(b'#'):
+                            continue
+                        match = _REQUIREMENT_RE.match(line)
+                        if match:
+                            dependencies.append(match.group(1).decode())
+                            if len(dependencies) == MAX_DEPENDENCIES:
+                                break
+            except Exception:
+                pass
         
-        return dependencies[:10]  # Limit to first 10 dependencies
+        return dependencies
     
-    def calculate_health_score(self, project_path: Path, language: str) -> int:
+    def calculate_health_score(self, project_path: Path, language: str, stats: Optional[Dict[str, Any]] = None) -> int:
         """Calculate project health score (0-100)"""
-        score = 100
+        if stats is None:
+            stats = self._collect_project_stats(project_path)
         
-        # Check for common issues
-        issues = []
+        score = 100
         
         # Check for README
-        if not (project_path / 'README.md').exists():
+        if not stats['has_readme']:
             score -= 10
-            issues.append("Missing README.md")
         
         # Check for .gitignore
-        if not (project_path / '.gitignore').exists():
+        if not stats['has_gitignore']:
             score -= 5
-            issues.append("Missing .gitignore")
         
         # Check for tests
-        test_dirs = ['tests', 'test', '__tests__', 'spec']
-        has_tests = any((project_path / test_dir).exists() for test_dir in test_dirs)
-        if not has_tests:
+        if not stats['has_tests']:
             score -= 15
-            issues.append("No test directory found")
         
         # Check for documentation
-        doc_dirs = ['docs', 'documentation', 'doc']
-        has_docs = any((project_path / doc_dir).exists() for doc_dir in doc_dirs)
-        if not has_docs:
+        if not stats['has_docs']:
             score -= 5
-            issues.append("No documentation directory")
         
-        # Check for large files
-        large_files = []
-        for file_path in project_path.rglob('*'):
-            if file_path.is_file() and file_path.stat().st_size > 10 * 1024 * 1024:  # 10MB
-                large_files.append(file_path.name)
-        
-        if large_files:
+        # Check for large files (collected by the shared tree walk)
+        if stats['large_files']:
             score -= 10
-            issues.append(f"Large files found: {', '.join(large_files[:3])}")
         
         return max(0, score)
     
-    def check_project_issues(self, project_path: Path, language: str) -> List[str]:
+    def check_project_issues(self, project_path: Path, language: str, stats: Optional[Dict[str, Any]] = None) -> List[str]:
         """Check for common project issues"""
+        if stats is None:
+            stats = self._collect_project_stats(project_path)
+        
         issues = []
         
         # Check for common problems
-        if not (project_path / 'README.md').exists():
+        if not stats['has_readme']:
             issues.append("Missing README.md")
         
-        if not (project_path / '.gitignore').exists():
+        if not stats['has_gitignore']:
             issues.append("Missing .gitignore")
         
         # Check for node_modules in git
-        if (project_path / 'node_modules').exists() and (project_path / '.git').exists():
+        if stats['has_node_modules'] and stats['has_git']:
             issues.append("node_modules should be in .gitignore")
         
         # Check for Python cache files
         if language == 'python':
-            cache_dirs = ['__pycache__', '.pytest_cache']
-            for cache_dir in cache_dirs:
-                if (project_path / cache_dir).exists():
-                    issues.append(f"Python cache directory found: {cache_dir}")
+            for cache_dir in stats['cache_dirs_present']:
+                issues.append(f"Python cache directory found: {cache_dir}")
         
         return issues
     
-    def get_project_status(self, project_path: Path) -> str:
-        """Get project status (active, inactive, etc.)"""
+    def get_project_status(self, stat_result: os.stat_result, now: Optional[float] = None) -> str:
+        """Get project status (active, inactive, etc.) from the directory's stat result"""
         # Check last modification time
-        stat = project_path.stat()
-        last_modified = datetime.datetime.fromtimestamp(stat.st_mtime)
-        days_since_modified = (datetime.datetime.now() - last_modified).days
+        if now is None:
+            now = time.time()
+        days_since_modified = int((now - stat_result.st_mtime) // 86400)
         
         if days_since_modified < 7:
             return "Active"
@@ -398,70 +809,8 @@ class ProjectManager:
     
     def create_basic_files(self, project_path: Path, name: str, language: str = None):
         """Create basic project files"""
-        # Create README.md
-        readme_content = f"""# {name}
-
-## Description
-{name} project
-
-## Setup
-\`\`\`bash
-# Install dependencies
-# Add setup instructions here
-
-# Run the project
-# Add run instructions here
-\`\`\`
-
-## Development
-\`\`\`bash
-# Development commands
-# Add development instructions here
-\`\`\`
-"""
-        with open(project_path / 'README.md', 'w') as f:
-            f.write(readme_content)
-        
-        # Create .gitignore
-        gitignore_content = """# Dependencies
-node_modules/
-__pycache__/
-*.pyc
-*.pyo
-*.pyd
-.Python
-env/
-venv/
-.venv/
-
-# IDE
-.vscode/
-.idea/
-*.swp
-*.swo
-
-# OS
-.DS_Store
-Thumbs.db
-
-# Logs
-*.log
-logs/
-
-# Environment
-.env
-.env.local
-.env.development.local
-.env.test.local
-.env.production.local
-
-# Build
-dist/
-build/
-*.egg-info/
-"""
-        with open(project_path / '.gitignore', 'w') as f:
-            f.write(gitignore_content)
+        (project_path / 'README.md').write_bytes(_README_TMPL.format(name=name).encode())
+        (project_path / '.gitignore').write_bytes(_GITIGNORE_TMPL)
         
         # Create language-specific files
         if language == 'python':
@@ -473,41 +822,9 @@ build/
     
     def create_python_project(self, project_path: Path, name: str):
         """Create Python project structure"""
-        # Create main Python file
-        main_py = f"""#!/usr/bin/env python3
-\"\"\"
-{name} - Main module
-\"\"\"
-
-def main():
-    print("Hello from {name}!")
-
-if __name__ == "__main__":
-    main()
-"""
-        with open(project_path / f"{name}.py", 'w') as f:
-            f.write(main_py)
-        
-        # Create requirements.txt
-        with open(project_path / 'requirements.txt', 'w') as f:
-            f.write("# Add your dependencies here\n")
-        
-        # Create setup.py
-        setup_py = f"""from setuptools import setup, find_packages
-
-setup(
-    name="{name}",
-    version="0.1.0",
-    description="A Python project",
-    author="Your Name",
-    author_email="your.email@example.com",
-    packages=find_packages(),
-    install_requires=[],
-    python_requires=">=3.7",
-)
-"""
-        with open(project_path / 'setup.py', 'w') as f:
-            f.write(setup_py)
+        (project_path / f"{name}.py").write_bytes(_MAIN_PY_TMPL.format(name=name).encode())
+        (project_path / 'requirements.txt').write_bytes(b"# Add your dependencies here\n")
+        (project_path / 'setup.py').write_bytes(_SETUP_PY_TMPL.format(name=name).encode())
     
     def create_javascript_project(self, project_path: Path, name: str):
         """Create JavaScript project structure"""
@@ -530,39 +847,16 @@ setup(
         with open(project_path / 'package.json', 'w') as f:
             json.dump(package_json, f, indent=2)
         
-        # Create index.js
-        index_js = f"""// {name} - Main entry point
-
-console.log('Hello from {name}!');
-
-// Add your code here
-"""
-        with open(project_path / 'index.js', 'w') as f:
-            f.write(index_js)
+        (project_path / 'index.js').write_bytes(_INDEX_JS_TMPL.format(name=name).encode())
     
     def create_rust_project(self, project_path: Path, name: str):
         """Create Rust project structure"""
-        # Create Cargo.toml
-        cargo_toml = f"""[package]
-name = "{name}"
-version = "0.1.0"
-edition = "2021"
-
-[dependencies]
-"""
-        with open(project_path / 'Cargo.toml', 'w') as f:
-            f.write(cargo_toml)
+        (project_path / 'Cargo.toml').write_bytes(_CARGO_TOML_TMPL.format(name=name).encode())
         
         # Create src directory and main.rs
         src_dir = project_path / 'src'
         src_dir.mkdir(exist_ok=True)
-        
-        main_rs = f"""fn main() {{
-    println!("Hello from {name}!");
-}}
-"""
-        with open(src_dir / 'main.rs', 'w') as f:
-            f.write(main_rs)
+        (src_dir / 'main.rs').write_bytes(_MAIN_RS_TMPL.format(name=name).encode())
     
     def apply_template(self, project_path: Path, template_name: str):
         """Apply a project template"""
@@ -578,6 +872,8 @@ edition = "2021"
             self.console.print("[yellow]No projects found![/yellow]")
             return
         
+        from rich.table import Table
+        
         # Create table
         table = Table(title="Development Projects")
         table.add_column("Name", style="cyan")
@@ -588,29 +884,26 @@ edition = "2021"
         table.add_column("Size", style="yellow")
         table.add_column("Last Modified", style="dim")
         
-        for project in projects:
-            health_color = "green" if project.health_score >= 80 else "yellow" if project.health_score >= 60 else "red"
-            table.add_row(
-                project.name,
-                project.type,
-                project.language,
-                project.status,
-                f"[{health_color}]{project.health_score}%[/{health_color}]",
-                project.size,
-                project.last_modified[:10]
-            )
+        rows = [
+            (project.name, project.type, project.language, project.status,
+             _health_cell(project.health_score), project.size, project.last_modified[:10])
+            for project in projects
+        ]
+        for row in rows:
+            table.add_row(*row)
         
         self.console.print(table)
     
     def show_project_details(self, project_name: str):
         """Show detailed information about a project"""
-        projects = self.scan_projects()
-        project = next((p for p in projects if p.name == project_name), None)
+        project = self._get_project(project_name)
         
         if not project:
             self.console.print(f"[red]Project '{project_name}' not found![/red]")
             return
         
+        from rich.panel import Panel
+        
         # Create detailed panel
         content = f"""
 [bold]Project:[/bold] {project.name}
@@ -638,8 +931,7 @@ edition = "2021"
     def backup_project(self, project_name: str) -> bool:
         """Backup a project"""
         try:
-            projects = self.scan_projects()
-            project = next((p for p in projects if p.name == project_name), None)
+            project = self._get_project(project_name)
             
             if not project:
                 self.console.print(f"[red]Project '{project_name}' not found![/red]")
@@ -649,8 +941,8 @@ edition = "2021"
             backup_dir = Path(self.config["backup_dir"]) / f"{project_name}_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
             backup_dir.mkdir(parents=True, exist_ok=True)
             
-            # Copy project
-            shutil.copytree(project.path, backup_dir / project_name)
+            # Snapshot project
+            self._snapshot_tree(project.path, backup_dir / project_name)
             
             self.console.print(f"[green]Project '{project_name}' backed up to {backup_dir}[/green]")
             return True
@@ -660,17 +952,59 @@ edition = "2021"
             self.console.print(f"[red]Error backing up project: {e}[/red]")
             return False
     
+    def _snapshot_tree(self, src: str, dest: Path):
+        """Copy a project tree using the cheapest method allowed by backup.mode
+        
+        Modes:
+          hardlink - link every file into the backup (files edited in place
+                     will also change in the backup)
+          reflink  - copy-on-write clone where the filesystem supports it,
+                     otherwise a regular copy
+          copy     - always copy file contents
+        """
+        mode = self.config["backup"].get("mode", "reflink")
+        
+        if mode == "hardlink":
+            try:
+                shutil.copytree(src, dest, copy_function=os.link)
+                return
+            except OSError as e:
+                # Cross-device backups or filesystems without hardlink support
+                logger.info(f"Hardlink snapshot failed, falling back to reflink: {e}")
+                shutil.rmtree(dest, ignore_errors=True)
+                mode = "reflink"
+        
+        if mode == "reflink":
+            if sys.platform.startswith('linux'):
+                cmd = ['cp', '-r', '--preserve=all', '--reflink=auto', str(src), str(dest)]
+            elif sys.platform == 'darwin':
+                cmd = ['cp', '-cpR', str(src), str(dest)]
+            else:
+                cmd = None
+            if cmd:
+                try:
+                    result = subprocess.run(cmd, capture_output=True, text=True)
+                    if result.returncode == 0:
+                        return
+                    logger.info(f"Reflink snapshot failed, falling back to copy: {result.stderr.strip()}")
+                except OSError as e:
+                    logger.info(f"Reflink snapshot failed, falling back to copy: {e}")
+                shutil.rmtree(dest, ignore_errors=True)
+        
+        shutil.copytree(src, dest, copy_function=_fast_copy)
+    
     def cleanup_old_backups(self):
         """Clean up old backups based on retention policy"""
         try:
             backup_dir = Path(self.config["backup_dir"])
             retention_days = self.config["backup"]["retention_days"]
+            now = time.time()
             
             for backup_path in backup_dir.iterdir():
                 if backup_path.is_dir():
                     # Check if backup is older than retention period
                     stat = backup_path.stat()
-                    days_old = (datetime.datetime.now() - datetime.datetime.fromtimestamp(stat.st_mtime)).days
+                    days_old = int((now - stat.st_mtime) // 86400)
                     
                     if days_old > retention_days:
                         shutil.rmtree(backup_path)
@@ -706,6 +1040,8 @@ edition = "2021"
     
     def run_interactive_mode(self):
         """Run interactive mode"""
+        from rich.prompt import Prompt
+        
         while True:
             self.console.print("\n[bold blue]Development Project Manager[/bold blue]")
             self.console.print("1. List projects")
@@ -742,6 +1078,8 @@ edition = "2021"
     
     def show_config(self):
         """Show current configuration"""
+        from rich.panel import Panel
+        
         config_panel = Panel(
             json.dumps(self.config, indent=2),
             title="Configuration",
@@ -750,6 +1088,16 @@ edition = "2021"
         self.console.print(config_panel)
 
 def main():
+    # Configure logging here so importing the module (as the GUI does) leaves logging alone
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('project_manager.log'),
+            logging.StreamHandler()
+        ]
+    )
+    
     parser = argparse.ArgumentParser(description="Development Project Manager")
     parser.add_argument("--config", default="config.json", help="Configuration file path")
     parser.add_argument("--list", action="store_true", help="List all projects")
@@ -8,20 +8,824 @@ monitoring, and maintenance capabilities.
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import json
+import copy
+import multiprocessing
+import sqlite3
+import mmap
 import os
+import re
 import subprocess
 import shutil
 import datetime
+import time
 from pathlib import Path
 import threading
+import queue
+from functools import lru_cache
 import webbrowser
-from typing import Dict, List, Optional
-import psutil
-import requests
+from typing import Dict, List, Optional, NamedTuple
 import sys
-import time
-import hashlib
-import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from project_manager import CASE_INSENSITIVE_FS, FoldedNames
+
+# Resolved once; these are consulted for every default config and export path
+_HOME = Path.home()
+_DEFAULT_PROJECTS_DIR = _HOME / "Projects"
+_DEFAULT_TEMPLATES_DIR = _HOME / "ProjectTemplates"
+_DEFAULT_BACKUP_DIR = _HOME / "ProjectBackups"
+
+# Dark theme palette shared by the widgets and the ttk style tables
+COLORS = {
+    'bg_primary': '#0d1117',      # GitHub dark
+    'bg_secondary': '#161b22',    # Slightly lighter
+    'bg_tertiary': '#21262d',     # Even lighter
+    'accent': '#238636',          # GitHub green
+    'accent_hover': '#2ea043',    # Lighter green
+    'text_primary': '#f0f6fc',    # Almost white
+    'text_secondary': '#8b949e',  # Muted text
+    'text_accent': '#58a6ff',     # Blue accent
+    'border': '#30363d',          # Subtle borders
+    'success': '#238636',         # Green
+    'warning': '#d29922',         # Orange
+    'error': '#f85149',           # Red
+    'info': '#58a6ff'             # Blue
+}
+
+# ttk style options applied once by setup_styles: (style name, options)
+_STYLE_CONFIGURE = (
+    ('TLabel', {
+        'background': COLORS['bg_primary'],
+        'foreground': COLORS['text_primary'],
+        'font': ('Segoe UI', 10)
+    }),
+    ('Title.TLabel', {
+        'font': ('Segoe UI', 18, 'bold'),
+        'foreground': COLORS['text_primary'],
+        'background': COLORS['bg_primary']
+    }),
+    ('Heading.TLabel', {
+        'font': ('Segoe UI', 12, 'bold'),
+        'foreground': COLORS['text_primary'],
+        'background': COLORS['bg_primary']
+    }),
+    ('Status.TLabel', {
+        'font': ('Segoe UI', 10),
+        'foreground': COLORS['text_secondary'],
+        'background': COLORS['bg_primary']
+    }),
+    ('Treeview', {
+        'background': COLORS['bg_secondary'],
+        'foreground': COLORS['text_primary'],
+        'fieldbackground': COLORS['bg_secondary'],
+        'borderwidth': 0,
+        'font': ('Segoe UI', 10)
+    }),
+    ('Treeview.Heading', {
+        'background': COLORS['bg_tertiary'],
+        'foreground': COLORS['text_primary'],
+        'font': ('Segoe UI', 10, 'bold'),
+        'borderwidth': 1,
+        'relief': 'flat'
+    }),
+    ('TNotebook', {
+        'background': COLORS['bg_primary'],
+        'borderwidth': 0
+    }),
+    ('TNotebook.Tab', {
+        'background': COLORS['bg_tertiary'],
+        'foreground': COLORS['text_secondary'],
+        'padding': [20, 12],
+        'font': ('Segoe UI', 10, 'bold'),
+        'borderwidth': 0
+    }),
+    ('TButton', {
+        'background': COLORS['accent'],
+        'foreground': COLORS['text_primary'],
+        'font': ('Segoe UI', 10, 'bold'),
+        'borderwidth': 0,
+        'focuscolor': 'none',
+        'padding': [15, 8]
+    }),
+    ('Secondary.TButton', {
+        'background': COLORS['bg_tertiary'],
+        'foreground': COLORS['text_primary'],
+        'font': ('Segoe UI', 10),
+        'borderwidth': 1,
+        'focuscolor': 'none',
+        'padding': [12, 6]
+    }),
+    ('TEntry', {
+        'background': COLORS['bg_secondary'],
+        'foreground': COLORS['text_primary'],
+        'fieldbackground': COLORS['bg_secondary'],
+        'borderwidth': 1,
+        'font': ('Segoe UI', 10),
+        'insertcolor': COLORS['text_primary']
+    }),
+    ('TCombobox', {
+        'background': COLORS['bg_secondary'],
+        'foreground': COLORS['text_primary'],
+        'fieldbackground': COLORS['bg_secondary'],
+        'borderwidth': 1,
+        'font': ('Segoe UI', 10)
+    }),
+    ('TFrame', {
+        'background': COLORS['bg_primary']
+    }),
+    ('Card.TFrame', {
+        'background': COLORS['bg_secondary'],
+        'relief': 'flat',
+        'borderwidth': 1
+    }),
+    ('TLabelframe', {
+        'background': COLORS['bg_primary'],
+        'foreground': COLORS['text_primary'],
+        'borderwidth': 1,
+        'relief': 'flat'
+    }),
+    ('TLabelframe.Label', {
+        'background': COLORS['bg_primary'],
+        'foreground': COLORS['text_accent'],
+        'font': ('Segoe UI', 11, 'bold')
+    }),
+    ('TProgressbar', {
+        'background': COLORS['accent'],
+        'troughcolor': COLORS['bg_tertiary'],
+        'borderwidth': 0,
+        'lightcolor': COLORS['accent'],
+        'darkcolor': COLORS['accent']
+    }),
+    ('TScrollbar', {
+        'background': COLORS['bg_tertiary'],
+        'troughcolor': COLORS['bg_secondary'],
+        'borderwidth': 0,
+        'arrowcolor': COLORS['text_secondary'],
+        'darkcolor': COLORS['bg_tertiary'],
+        'lightcolor': COLORS['bg_tertiary']
+    }),
+)
+
+# State-dependent style options: (style name, {option: [(state, value), ...]})
+_STYLE_MAP = (
+    ('TNotebook.Tab', {
+        'background': [('selected', COLORS['accent']), ('active', COLORS['bg_secondary'])],
+        'foreground': [('selected', COLORS['text_primary']), ('active', COLORS['text_primary'])]
+    }),
+    ('TButton', {
+        'background': [('active', COLORS['accent_hover']), ('pressed', COLORS['accent'])]
+    }),
+    ('Secondary.TButton', {
+        'background': [('active', COLORS['bg_secondary']), ('pressed', COLORS['bg_tertiary'])]
+    }),
+    ('TEntry', {
+        'fieldbackground': [('focus', COLORS['bg_tertiary'])]
+    }),
+    ('TScrollbar', {
+        'background': [('active', COLORS['bg_secondary'])]
+    }),
+)
+
+# Choices offered by the create-project language and projects health-filter comboboxes
+_LANGUAGE_CHOICES = (
+    "python", "javascript", "typescript", "java", "csharp", "cpp", "c", "go", "rust",
+    "php", "ruby", "swift", "kotlin", "dart", "scala", "groovy", "haskell", "clojure",
+    "lua", "perl", "r", "julia", "nim", "zig", "v", "assembly",
+    "html", "css", "vue", "react", "angular", "svelte", "nextjs", "nuxt", "gatsby",
+    "bash", "powershell", "batch", "zsh", "fish",
+    "sql", "markdown", "json", "yaml", "xml",
+)
+_HEALTH_FILTER_CHOICES = ("All", "Healthy (80%+)", "Warning (60-79%)", "Critical (<60%)")
+
+# Manifests whose edits invalidate a cached project
+_CACHE_KEY_FILES = frozenset({
+    'package.json', 'requirements.txt', 'Cargo.toml', 'go.mod', 'pom.xml',
+    'composer.json', 'Gemfile', 'setup.py', 'pyproject.toml', 'README.md'
+})
+
+# Bump when the layout of cached project records changes
+CACHE_VERSION = 4
+
+# Directories that never count toward a project's size or modification time
+PRUNE_DIRS = frozenset({
+    '.git', 'node_modules', '__pycache__', 'venv', '.venv', 'target', 'build', 'dist',
+    '.next', '.nuxt', '.cache', '.pytest_cache', '.mypy_cache'
+})
+
+
+# Command that opens a folder in the platform's file manager
+if sys.platform == 'win32':
+    _FILE_MANAGER_CMD = ['explorer']
+elif sys.platform == 'darwin':
+    _FILE_MANAGER_CMD = ['open']
+else:
+    _FILE_MANAGER_CMD = ['xdg-open']
+
+# Size scans for the projects table stop after this many files and show a lower bound
+SIZE_SCAN_FILE_LIMIT = 50_000
+
+# Time budget for the size walk of a project's quick analysis during loading
+QUICK_SCAN_SECONDS = 0.5
+
+
+class TreeStats(NamedTuple):
+    size: int
+    mtime_ns: int
+    file_count: int
+    approximate: bool = False
+
+
+def _scan_tree(path, prune=PRUNE_DIRS, limit=None, deadline=None) -> TreeStats:
+    """Walk a tree with os.scandir, totalling file sizes and the newest mtime, within optional file/time bounds"""
+    total_size = 0
+    newest_mtime_ns = 0
+    file_count = 0
+    stack = [path]
+    
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    # Bounds are checked per entry so one huge flat directory can't run past them;
+                    # the totals so far are a lower bound, good enough for display
+                    if deadline is not None and time.monotonic() >= deadline:
+                        return TreeStats(total_size, newest_mtime_ns, file_count, True)
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in prune:
+                                stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            if limit is not None and file_count >= limit:
+                                return TreeStats(total_size, newest_mtime_ns, file_count, True)
+                            # DirEntry caches this stat where the platform allows
+                            stat = entry.stat(follow_symlinks=False)
+                            total_size += stat.st_size
+                            if stat.st_mtime_ns > newest_mtime_ns:
+                                newest_mtime_ns = stat.st_mtime_ns
+                            file_count += 1
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+    
+    return TreeStats(total_size, newest_mtime_ns, file_count)
+
+
+def _iter_files(path, prune=PRUNE_DIRS):
+    """Lazily yield a DirEntry for every regular file under path, skipping pruned directories"""
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in prune:
+                                stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+
+
+def _subdirs(path) -> list:
+    """Non-hidden subdirectories of path as DirEntry objects, typed from readdir instead of a stat each"""
+    with os.scandir(path) as entries:
+        return [entry for entry in entries if entry.name[0] != '.' and entry.is_dir()]
+
+
+@lru_cache(maxsize=1024)
+def _listdir_cached(path: str, mtime_ns: int) -> frozenset:
+    """List a directory once per mtime; adding or removing an entry bumps the directory's mtime"""
+    names = os.listdir(path)
+    return FoldedNames(names) if CASE_INSENSITIVE_FS else frozenset(names)
+
+
+def _dir_names(path) -> frozenset:
+    """Names of the entries in a directory, shared by every indicator check on it"""
+    path = os.fspath(path)
+    try:
+        return _listdir_cached(path, os.stat(path).st_mtime_ns)
+    except OSError:
+        return frozenset()
+
+
+# Directory entries the project detection helpers look for
+QUICK_INDICATORS = frozenset({
+    'package.json', 'requirements.txt', 'Cargo.toml', 'go.mod', 'pom.xml',
+    'composer.json', 'Gemfile', 'setup.py', 'README.md'
+})
+SRC_DIRS = frozenset({'src', 'lib', 'app'})
+PROJECT_INDICATORS = QUICK_INDICATORS | SRC_DIRS
+OBVIOUS_MONOREPO_DIRS = frozenset({'packages', 'apps', 'services', 'modules', 'libs'})
+MONOREPO_DIRS = OBVIOUS_MONOREPO_DIRS | {'components'}
+SUBPROJECT_DIRS = MONOREPO_DIRS | SRC_DIRS | {'client', 'server', 'frontend', 'backend'}
+WORKSPACE_FILES = frozenset({'package.json', 'lerna.json', 'nx.json', 'rush.json'})
+SINGLE_PROJECT_MANIFESTS = frozenset({'package.json', 'requirements.txt', 'Cargo.toml', 'go.mod', 'pom.xml'})
+PROJECT_MANIFESTS = frozenset({
+    # Package managers
+    'package.json', 'requirements.txt', 'Cargo.toml', 'go.mod', 'pom.xml',
+    'composer.json', 'Gemfile', 'setup.py', 'pyproject.toml',
+    
+    # Build files
+    'Makefile'
+})
+PROJECT_SRC_DIRS = frozenset({'src', 'lib', 'app', 'source', 'code'})
+
+# Folder names (lower-cased) the scanner skips without looking inside
+OBVIOUS_NON_PROJECTS = frozenset({
+    # Common non-project folders
+    'node_modules', 'venv', 'env', '.venv', '.env', '__pycache__',
+    'target', 'build', 'dist', 'out', 'bin', 'obj', 'classes',
+    '.git', '.svn', '.hg', '.bzr', '.vscode', '.idea', '.vs',
+    'tmp', 'temp', 'cache', '.cache', 'logs', '.logs',
+    '.next', '.nuxt', '.gatsby', '.svelte-kit', '.astro',
+    'public', 'static', 'assets', 'media', 'docs', 'documentation'
+})
+
+# Framework-generated and other non-project folders _is_project_directory rejects
+EXCLUDED_FOLDERS = frozenset({
+    # Node.js frameworks
+    'node_modules', '.next', '.nuxt', '.vuepress', '.docusaurus',
+    'dist', 'build', 'out', '.output', '.vercel', '.netlify',
+    
+    # Python frameworks
+    '__pycache__', '.pytest_cache', '.mypy_cache', 'venv', 'env',
+    '.venv', '.env', 'site-packages', 'egg-info',
+    
+    # Java frameworks
+    'target', '.gradle', '.mvn', 'bin', 'classes',
+    
+    # Build outputs
+    'build', 'dist', 'out', 'target', 'bin', 'obj',
+    
+    # IDE and editor folders
+    '.vscode', '.idea', '.vs', '.eclipse', '.settings',
+    
+    # Version control
+    '.git', '.svn', '.hg', '.bzr',
+    
+    # OS folders
+    '.DS_Store', 'Thumbs.db', '.Trash',
+    
+    # Temporary folders
+    'tmp', 'temp', 'cache', '.cache', 'logs', '.logs',
+    
+    # Framework-specific
+    '.next', '.nuxt', '.gatsby', '.svelte-kit', '.astro',
+    'public', 'static', 'assets', 'media'
+})
+
+# Top-level source files that mark a directory as a project
+_LIKELY_PROJECT_EXTS = frozenset({'.py', '.js', '.ts', '.java', '.cpp', '.c'})
+_PROJECT_SOURCE_EXTS = frozenset({
+    '.py', '.js', '.ts', '.java', '.cpp', '.c', '.go', '.rs', '.php', '.rb', '.swift', '.kt', '.dart', '.sh'
+})
+
+# Framework config files that don't count as project sources on their own
+_FRAMEWORK_CONFIG_FILES = frozenset({
+    'next.config.js', 'nuxt.config.js', 'vue.config.js', 'svelte.config.js',
+    'tailwind.config.js', 'postcss.config.js', 'babel.config.js',
+    'webpack.config.js', 'rollup.config.js', 'vite.config.js',
+    'jest.config.js', 'cypress.config.js', 'playwright.config.js'
+})
+
+
+# Comprehensive file extension to language mapping
+_EXT_TO_LANG = {
+    # Python ecosystem
+    '.py': 'python', '.pyi': 'python', '.pyc': 'python', '.pyo': 'python',
+
+    # JavaScript/TypeScript ecosystem
+    '.js': 'javascript', '.jsx': 'javascript', '.mjs': 'javascript',
+    '.ts': 'typescript', '.tsx': 'typescript', '.d.ts': 'typescript',
+
+    # Java ecosystem
+    '.java': 'java', '.kt': 'kotlin', '.scala': 'scala', '.groovy': 'groovy',
+    '.jsp': 'jsp', '.jspx': 'jsp',
+
+    # C/C++ ecosystem
+    '.c': 'c', '.h': 'c', '.cpp': 'cpp', '.cxx': 'cpp', '.cc': 'cpp',
+    '.hpp': 'cpp', '.hxx': 'cpp', '.h++': 'cpp', '.c++': 'cpp',
+
+    # C# ecosystem
+    '.cs': 'csharp', '.csx': 'csharp',
+
+    # Go
+    '.go': 'go',
+
+    # Rust
+    '.rs': 'rust',
+
+    # PHP
+    '.php': 'php', '.phtml': 'php', '.php3': 'php', '.php4': 'php', '.php5': 'php',
+
+    # Ruby
+    '.rb': 'ruby', '.rbw': 'ruby', '.rake': 'ruby',
+
+    # Shell scripting
+    '.sh': 'bash', '.bash': 'bash', '.zsh': 'zsh', '.fish': 'fish',
+    '.ps1': 'powershell', '.psm1': 'powershell', '.psd1': 'powershell',
+    '.bat': 'batch', '.cmd': 'batch',
+
+    # Web technologies
+    '.html': 'html', '.htm': 'html', '.xhtml': 'html',
+    '.css': 'css', '.scss': 'scss', '.sass': 'sass', '.less': 'less',
+    '.xml': 'xml', '.svg': 'svg',
+
+    # Data formats
+    '.json': 'json', '.yaml': 'yaml', '.yml': 'yaml', '.toml': 'toml',
+    '.ini': 'ini', '.cfg': 'config', '.conf': 'config',
+
+    # Database
+    '.sql': 'sql', '.sqlite': 'sqlite', '.db': 'database',
+
+    # Documentation
+    '.md': 'markdown', '.rst': 'restructuredtext', '.tex': 'latex',
+    '.txt': 'text', '.log': 'log',
+
+    # Mobile development
+    '.swift': 'swift', '.m': 'objective-c', '.mm': 'objective-c++',
+    '.dart': 'dart', '.java': 'java',  # Android
+
+    # Functional languages
+    '.hs': 'haskell', '.elm': 'elm', '.fs': 'fsharp', '.fsx': 'fsharp',
+    '.clj': 'clojure', '.cljs': 'clojurescript',
+
+    # Scripting languages
+    '.lua': 'lua', '.pl': 'perl', '.pm': 'perl',
+    '.r': 'r', '.R': 'r',
+    '.jl': 'julia',
+
+    # System languages
+    '.asm': 'assembly', '.s': 'assembly',
+    '.nim': 'nim', '.zig': 'zig', '.v': 'v',
+
+    # Web frameworks and tools
+    '.vue': 'vue', '.svelte': 'svelte',
+    '.jsx': 'react', '.tsx': 'react',
+    '.angular': 'angular',
+
+    # Configuration and build
+    '.dockerfile': 'dockerfile', '.makefile': 'makefile',
+    '.cmake': 'cmake', '.gradle': 'gradle',
+    '.maven': 'maven', '.ant': 'ant',
+
+    # Other
+    '.shader': 'shader', '.glsl': 'glsl', '.hlsl': 'hlsl',
+    '.proto': 'protobuf', '.thrift': 'thrift',
+    '.graphql': 'graphql', '.gql': 'graphql'
+}
+
+# Configuration files and framework names; a file matches when the key appears in its name
+_CONFIG_FILE_LANGS = {
+    # JavaScript/Node.js ecosystem
+    'package.json': 'javascript', 'yarn.lock': 'javascript', 'package-lock.json': 'javascript',
+    'webpack.config.js': 'javascript', 'rollup.config.js': 'javascript',
+    'vite.config.js': 'javascript', 'next.config.js': 'nextjs',
+    'nuxt.config.js': 'nuxt', 'nuxt.config.ts': 'nuxt',
+    'vue.config.js': 'vue', 'vue.config.ts': 'vue',
+    'angular.json': 'angular', 'angular-cli.json': 'angular',
+    'svelte.config.js': 'svelte', 'svelte.config.cjs': 'svelte', 'svelte.config.ts': 'svelte',
+    'remix.config.js': 'remix', 'remix.config.ts': 'remix',
+    'astro.config.js': 'astro', 'astro.config.mjs': 'astro', 'astro.config.ts': 'astro',
+    'gatsby-config.js': 'gatsby', 'gatsby-config.ts': 'gatsby',
+    'sanity.config.js': 'sanity', 'sanity.config.ts': 'sanity',
+    'tailwind.config.js': 'tailwind', 'tailwind.config.ts': 'tailwind',
+    'postcss.config.js': 'postcss', 'postcss.config.ts': 'postcss',
+    'babel.config.js': 'babel', 'babel.config.json': 'babel',
+    'jest.config.js': 'jest', 'jest.config.ts': 'jest',
+    'cypress.config.js': 'cypress', 'cypress.config.ts': 'cypress',
+    'playwright.config.js': 'playwright', 'playwright.config.ts': 'playwright',
+    'vitest.config.js': 'vitest', 'vitest.config.ts': 'vitest',
+    'eslint.config.js': 'eslint', 'eslint.config.mjs': 'eslint',
+    'prettier.config.js': 'prettier', 'prettier.config.json': 'prettier',
+    'tsconfig.json': 'typescript', 'jsconfig.json': 'javascript',
+    'turborepo.json': 'turborepo', 'nx.json': 'nx',
+    'lerna.json': 'lerna', 'rush.json': 'rush',
+
+    # Python ecosystem
+    'requirements.txt': 'python', 'pyproject.toml': 'python', 'setup.py': 'python',
+    'Pipfile': 'python', 'poetry.lock': 'python', 'conda.yml': 'python',
+    'Django': 'django', 'Flask': 'flask', 'FastAPI': 'fastapi',
+
+    # Java ecosystem
+    'pom.xml': 'java', 'build.gradle': 'java', 'build.gradle.kts': 'java',
+    'gradle.properties': 'java', 'settings.gradle': 'java',
+    'spring-boot': 'spring', 'maven': 'maven',
+
+    # C# ecosystem
+    '*.csproj': 'csharp', '*.sln': 'csharp', '*.vbproj': 'vbnet',
+    'project.json': 'csharp', 'global.json': 'csharp',
+
+    # Go
+    'go.mod': 'go', 'go.sum': 'go', 'Gopkg.toml': 'go',
+
+    # Rust
+    'Cargo.toml': 'rust', 'Cargo.lock': 'rust',
+
+    # PHP
+    'composer.json': 'php', 'composer.lock': 'php',
+    'laravel': 'laravel', 'symfony': 'symfony',
+
+    # Ruby
+    'Gemfile': 'ruby', 'Gemfile.lock': 'ruby', 'Rakefile': 'ruby',
+    'rails': 'rails', 'sinatra': 'sinatra',
+
+    # Web frameworks
+    'next.js': 'nextjs', 'nuxt.js': 'nuxt', 'gatsby': 'gatsby',
+    'svelte': 'svelte', 'vue': 'vue', 'react': 'react',
+    'angular': 'angular', 'ember': 'ember',
+
+    # Mobile frameworks
+    'react-native': 'react-native', 'flutter': 'flutter',
+    'ionic': 'ionic', 'cordova': 'cordova',
+
+    # Build tools
+    'Makefile': 'make', 'CMakeLists.txt': 'cmake',
+    'Dockerfile': 'docker', 'docker-compose.yml': 'docker',
+    'Jenkinsfile': 'jenkins', '.github/workflows': 'github-actions',
+
+    # Configuration
+    'webpack': 'webpack', 'babel': 'babel', 'eslint': 'eslint',
+    'prettier': 'prettier', 'typescript': 'typescript',
+    'tailwind': 'tailwind', 'bootstrap': 'bootstrap',
+
+    # Database
+    'prisma': 'prisma', 'sequelize': 'sequelize', 'mongoose': 'mongoose',
+    'typeorm': 'typeorm', 'sqlalchemy': 'sqlalchemy',
+
+    # Testing
+    'jest': 'jest', 'mocha': 'mocha', 'cypress': 'cypress',
+    'pytest': 'pytest', 'unittest': 'unittest',
+
+    # Documentation
+    'docusaurus': 'docusaurus', 'gitbook': 'gitbook',
+    'mkdocs': 'mkdocs', 'sphinx': 'sphinx'
+}
+
+
+# Matches any name containing one of the config keys; most file names contain none, and for
+# those a single C-level search replaces the per-key substring checks
+_CONFIG_NAME_RE = re.compile('|'.join(map(re.escape, _CONFIG_FILE_LANGS)))
+
+
+@lru_cache(maxsize=4096)
+def _config_file_languages(name: str) -> tuple:
+    """Languages implied by a file name; memoized since names like index.js repeat across a tree"""
+    return tuple({language for config_file, language in _CONFIG_FILE_LANGS.items() if config_file in name})
+
+
+# Files modified within this window count toward a project's recent-activity bonus
+_RECENT_WINDOW_NS = 30 * 86400 * 1_000_000_000
+
+
+class ProjectScan(NamedTuple):
+    stats: TreeStats
+    languages: frozenset
+    recent_files: int
+
+
+def _scan_project(path, recent_since_ns=None, prune=PRUNE_DIRS, limit=SIZE_SCAN_FILE_LIMIT) -> ProjectScan:
+    """Walk a project once, collecting its size, newest mtime, languages and recently modified files"""
+    total_size = 0
+    newest_mtime_ns = 0
+    file_count = 0
+    recent_files = 0
+    found = set()
+    # Raw suffix -> language; a tree repeats a handful of suffixes, so this skips the lower() copies
+    suffix_langs = {}
+    stack = [path]
+    
+    while stack:
+        if limit is not None and file_count >= limit:
+            stats = TreeStats(total_size, newest_mtime_ns, file_count, True)
+            return ProjectScan(stats, frozenset(found), recent_files)
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in prune:
+                                stack.append(entry.path)
+                            continue
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        stat = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    
+                    total_size += stat.st_size
+                    if stat.st_mtime_ns > newest_mtime_ns:
+                        newest_mtime_ns = stat.st_mtime_ns
+                    file_count += 1
+                    
+                    name = entry.name
+                    if recent_since_ns is not None and stat.st_mtime_ns >= recent_since_ns and not name.startswith('.'):
+                        recent_files += 1
+                    
+                    # Same rule as Path.suffix, minus the Path object
+                    dot = name.rfind('.')
+                    if dot > 0:
+                        suffix = name[dot:]
+                        try:
+                            lang = suffix_langs[suffix]
+                        except KeyError:
+                            lang = suffix_langs[suffix] = _EXT_TO_LANG.get(suffix.lower())
+                        if lang:
+                            found.add(lang)
+                    if _CONFIG_NAME_RE.search(name):
+                        found.update(_config_file_languages(name))
+        except OSError:
+            pass
+    
+    return ProjectScan(TreeStats(total_size, newest_mtime_ns, file_count), frozenset(found), recent_files)
+
+
+@lru_cache(maxsize=64)
+def _read_json_cached(path: str, mtime_ns: int):
+    """Parse a JSON file once per mtime_ns so an edited file is read again; callers must treat the result as read-only"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _read_manifest(path):
+    """Parsed JSON manifest, shared by every check that reads it during an analysis"""
+    path = os.fspath(path)
+    return _read_json_cached(path, os.stat(path).st_mtime_ns)
+
+
+# Manifests _quick_project_type looks at
+_QUICK_TYPE_MANIFESTS = frozenset({
+    'package.json', 'requirements.txt', 'setup.py', 'Cargo.toml', 'go.mod', 'pom.xml', 'composer.json', 'Gemfile'
+})
+
+
+@lru_cache(maxsize=4096)
+def _quick_project_type(manifests: frozenset) -> tuple:
+    """Map the manifests present in a project root to (type, language, framework)"""
+    # Check for obvious indicators
+    if 'package.json' in manifests:
+        return ('nodejs', 'javascript', 'node')
+    elif 'requirements.txt' in manifests or 'setup.py' in manifests:
+        return ('python', 'python', 'flask')
+    elif 'Cargo.toml' in manifests:
+        return ('rust', 'rust', 'cargo')
+    elif 'go.mod' in manifests:
+        return ('go', 'go', 'go')
+    elif 'pom.xml' in manifests:
+        return ('java', 'java', 'maven')
+    elif 'composer.json' in manifests:
+        return ('php', 'php', 'composer')
+    elif 'Gemfile' in manifests:
+        return ('ruby', 'ruby', 'bundler')
+    else:
+        return ('generic', 'unknown', 'unknown')
+
+
+# Language priority based on common project patterns, for picking a multi-language project's primary one
+_LANG_PRIORITY = {
+    # Web development
+    'javascript': 10, 'typescript': 10, 'html': 8, 'css': 7,
+    'vue': 9, 'react': 9, 'angular': 9, 'svelte': 9,
+    'nextjs': 9, 'nuxt': 9, 'gatsby': 9,
+
+    # Backend languages
+    'python': 8, 'java': 8, 'csharp': 8, 'go': 8, 'rust': 8,
+    'php': 7, 'ruby': 7, 'nodejs': 7,
+
+    # Mobile development
+    'swift': 8, 'dart': 8, 'kotlin': 8, 'react-native': 8,
+
+    # System languages
+    'c': 6, 'cpp': 6, 'assembly': 5,
+
+    # Scripting
+    'bash': 5, 'powershell': 5, 'lua': 4, 'perl': 4,
+
+    # Data and documentation
+    'sql': 4, 'markdown': 3, 'json': 3, 'yaml': 3
+}
+
+# Manifests that settle a multi-language project's primary language when that language was detected
+_FRAMEWORK_INDICATORS = {
+    'package.json': 'javascript',
+    'requirements.txt': 'python',
+    'Cargo.toml': 'rust',
+    'go.mod': 'go',
+    'pom.xml': 'java',
+    'composer.json': 'php',
+    'Gemfile': 'ruby'
+}
+
+# Root files that identify a single-language project's (type, language, framework)
+_PROJECT_TYPE_FILES = {
+    'package.json': ('nodejs', 'javascript', 'node'),
+    'requirements.txt': ('python', 'python', 'flask'),
+    'Cargo.toml': ('rust', 'rust', 'cargo'),
+    'go.mod': ('go', 'go', 'go'),
+    'pom.xml': ('java', 'java', 'maven'),
+    'composer.json': ('php', 'php', 'composer'),
+    'Gemfile': ('ruby', 'ruby', 'bundler'),
+    'Dockerfile': ('docker', 'docker', 'docker'),
+    'docker-compose.yml': ('docker', 'docker', 'docker-compose'),
+    'Makefile': ('c', 'c', 'make'),
+    'CMakeLists.txt': ('cpp', 'cpp', 'cmake')
+}
+
+# package.json dependencies that identify a JavaScript framework or tool
+_FRAMEWORK_DEPS = {
+    # React ecosystem
+    'react': 'react', 'react-dom': 'react', 'next': 'nextjs',
+    'gatsby': 'gatsby', 'remix': 'remix',
+
+    # Vue ecosystem
+    'vue': 'vue', 'nuxt': 'nuxt', 'vue-router': 'vue',
+    'vuex': 'vue', 'pinia': 'vue',
+
+    # Angular ecosystem
+    '@angular/core': 'angular', '@angular/common': 'angular',
+    '@angular/platform-browser': 'angular',
+
+    # Svelte ecosystem
+    'svelte': 'svelte', 'sveltekit': 'svelte',
+
+    # Astro
+    'astro': 'astro',
+
+    # Build tools
+    'vite': 'vite', 'webpack': 'webpack', 'rollup': 'rollup',
+    'parcel': 'parcel', 'esbuild': 'esbuild',
+
+    # CSS frameworks
+    'tailwindcss': 'tailwind', 'bootstrap': 'bootstrap',
+    'bulma': 'bulma', 'materialize-css': 'materialize',
+    'antd': 'antd', 'chakra-ui': 'chakra', 'mantine': 'mantine',
+
+    # Testing frameworks
+    'jest': 'jest', 'vitest': 'vitest', 'cypress': 'cypress',
+    'playwright': 'playwright', 'puppeteer': 'puppeteer',
+    'testing-library': 'testing-library',
+
+    # State management
+    'redux': 'redux', 'mobx': 'mobx', 'zustand': 'zustand',
+    'jotai': 'jotai', 'recoil': 'recoil',
+
+    # UI libraries
+    'material-ui': 'mui', '@mui/material': 'mui',
+    'ant-design': 'antd', 'semantic-ui-react': 'semantic',
+    'react-bootstrap': 'react-bootstrap',
+
+    # Backend frameworks
+    'express': 'express', 'fastify': 'fastify', 'koa': 'koa',
+    'nest': 'nestjs', 'adonisjs': 'adonisjs',
+
+    # Database ORMs
+    'prisma': 'prisma', 'sequelize': 'sequelize', 'mongoose': 'mongoose',
+    'typeorm': 'typeorm', 'drizzle': 'drizzle',
+
+    # Full-stack frameworks
+    't3': 't3', 'blitz': 'blitz', 'redwood': 'redwood',
+    'sails': 'sails', 'strapi': 'strapi', 'keystone': 'keystone'
+}
+
+# Root config files that identify a JavaScript framework or tool
+_FRAMEWORK_CONFIGS = {
+    'next.config.js': 'nextjs', 'next.config.ts': 'nextjs',
+    'nuxt.config.js': 'nuxt', 'nuxt.config.ts': 'nuxt',
+    'vue.config.js': 'vue', 'vue.config.ts': 'vue',
+    'angular.json': 'angular', 'angular-cli.json': 'angular',
+    'svelte.config.js': 'svelte', 'svelte.config.ts': 'svelte',
+    'remix.config.js': 'remix', 'remix.config.ts': 'remix',
+    'astro.config.js': 'astro', 'astro.config.ts': 'astro',
+    'gatsby-config.js': 'gatsby', 'gatsby-config.ts': 'gatsby',
+    'tailwind.config.js': 'tailwind', 'tailwind.config.ts': 'tailwind',
+    'vite.config.js': 'vite', 'vite.config.ts': 'vite',
+    'webpack.config.js': 'webpack', 'webpack.config.ts': 'webpack',
+    'rollup.config.js': 'rollup', 'rollup.config.ts': 'rollup',
+    'jest.config.js': 'jest', 'jest.config.ts': 'jest',
+    'cypress.config.js': 'cypress', 'cypress.config.ts': 'cypress',
+    'playwright.config.js': 'playwright', 'playwright.config.ts': 'playwright',
+    'vitest.config.js': 'vitest', 'vitest.config.ts': 'vitest'
+}
+
+# Words the health score treats as a hint of hardcoded secrets, matched case-insensitively
+# against raw file bytes so the search runs in C without decoding or lowercasing a copy
+_SECRET_RE = re.compile(rb'password|secret|key|token|api_key', re.IGNORECASE)
+
+
+def _analyze_project_worker(path_str: str) -> Optional[Dict]:
+    """Run the full project analysis in a worker process"""
+    # The analysis methods only touch the filesystem, so no Tk state is needed
+    analyzer = ProjectManagerGUI.__new__(ProjectManagerGUI)
+    return analyzer.analyze_project(Path(path_str))
+
+def _exact_size_worker(path_str: str) -> Dict:
+    """Total every file of a project, without the display file limit, in a worker process"""
+    analyzer = ProjectManagerGUI.__new__(ProjectManagerGUI)
+    return {'size': analyzer.get_directory_size(Path(path_str), limit=None)}
 
 class ProjectManagerGUI:
     def __init__(self, root):
@@ -40,31 +844,39 @@ class ProjectManagerGUI:
         self.projects = []
         
         # Cache setup
-        self.cache_dir = Path.home() / '.dev-project-manager' / 'cache'
+        self.cache_dir = _HOME / '.dev-project-manager' / 'cache'
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_file = self.cache_dir / 'project_cache.pkl'
-        
-        # Background processing variables
-        self.background_queue = []
-        self.processing_in_background = False
-        self.batch_size = 2  # Process 1-2 projects at a time
+        self.cache_file = self.cache_dir / 'index.sqlite'
+        
+        # Background processing variables: projects queued for full analysis are
+        # drained in batches by a single daemon worker
+        self.bg_q = queue.Queue()
+        self.batch_size = 8
+        self._process_pool = None
+        self._thread_pool = None
+        threading.Thread(target=self._bg_worker, daemon=True).start()
+        
+        # Candidate directories of a scan level are probed in parallel
+        self._scan_pool = ThreadPoolExecutor(max_workers=8)
+        
+        # Cache writes requested from the Tk thread run here, one at a time
+        self._cache_writer = ThreadPoolExecutor(max_workers=1)
+        
+        # Per-path detection answers, shared by the scan threads and reset on every full scan
+        self._likely_project_memo = {}
+        self._collection_memo = {}
+        self._indicator_memo = {}
+        
+        # Project loading runs on a worker thread; only one scan at a time. It streams
+        # ('project', info) items and a final ('done', scan) over _scan_queue
+        self._scan_queue = queue.Queue()
+        self._scan_projects = []
+        self._load_lock = threading.Lock()
+        self._loading_projects = False
+        self._reload_requested = False
         
         # Define colors early for use in widgets
-        self.colors = {
-            'bg_primary': '#0d1117',      # GitHub dark
-            'bg_secondary': '#161b22',    # Slightly lighter
-            'bg_tertiary': '#21262d',     # Even lighter
-            'accent': '#238636',          # GitHub green
-            'accent_hover': '#2ea043',    # Lighter green
-            'text_primary': '#f0f6fc',    # Almost white
-            'text_secondary': '#8b949e',  # Muted text
-            'text_accent': '#58a6ff',     # Blue accent
-            'border': '#30363d',          # Subtle borders
-            'success': '#238636',         # Green
-            'warning': '#d29922',         # Orange
-            'error': '#f85149',           # Red
-            'info': '#58a6ff'             # Blue
-        }
+        self.colors = COLORS
         
         # Create GUI elements
         self.create_widgets()
@@ -74,9 +886,9 @@ class ProjectManagerGUI:
     def load_config(self):
         """Load configuration from file or create default"""
         default_config = {
-            "projects_dir": os.path.expanduser("~/Projects"),
-            "templates_dir": os.path.expanduser("~/ProjectTemplates"),
-            "backup_dir": os.path.expanduser("~/ProjectBackups"),
+            "projects_dir": str(_DEFAULT_PROJECTS_DIR),
+            "templates_dir": str(_DEFAULT_TEMPLATES_DIR),
+            "backup_dir": str(_DEFAULT_BACKUP_DIR),
             "monitoring": {
                 "enabled": True,
                 "check_interval": 300,
@@ -96,8 +908,9 @@ class ProjectManagerGUI:
         
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, 'r') as f:
-                    config = json.load(f)
+                mtime_ns = os.stat(self.config_path).st_mtime_ns
+                # Callers modify the config in place, so never hand out the cached dict itself
+                config = copy.deepcopy(_read_json_cached(self.config_path, mtime_ns))
                 # Merge with defaults
                 for key, value in default_config.items():
                     if key not in config:
@@ -117,6 +930,8 @@ class ProjectManagerGUI:
         try:
             with open(self.config_path, 'w') as f:
                 json.dump(config, f, indent=2)
+            # A save within the mtime granularity would otherwise leave the old parse cached
+            _read_json_cached.cache_clear()
         except Exception as e:
             print(f"Error saving config: {e}")
     
@@ -181,7 +996,7 @@ class ProjectManagerGUI:
         # Health filter with modern styling
         health_var = tk.StringVar(value="All")
         health_combo = ttk.Combobox(controls_frame, textvariable=health_var, 
-                                   values=["All", "Healthy (80%+)", "Warning (60-79%)", "Critical (<60%)"],
+                                   values=_HEALTH_FILTER_CHOICES,
                                    state="readonly")
         health_combo.pack(side=tk.RIGHT, padx=(10, 15), pady=10)
         health_combo.bind('<<ComboboxSelected>>', self.filter_projects)
@@ -243,11 +1058,27 @@ class ProjectManagerGUI:
         # Track which items have been fully loaded
         self.loaded_items = set()
         
+        # What refresh_projects last rendered, so it only touches rows that changed:
+        # project iid -> (parent iid, text, values), parent iid -> ordered child iids,
+        # and project iid -> its '…loading' placeholder iid
+        self._tree_rows = {}
+        self._tree_children = {}
+        self._tree_placeholders = {}
+        
+        # after() id of a coalesced refresh_projects call, see _schedule_refresh
+        self._refresh_pending = None
+        
+        # Right-click menu, built on first use and reused; see show_context_menu
+        self._context_menu = None
+        self._bulk_ops_index = None
+        self._bulk_ops_shown = False
+        
         # Multi-selection support
         self.tree.configure(selectmode='extended')  # Allow multiple selection
         
         # Store scrollbar reference for dynamic visibility
         self.h_scrollbar = h_scrollbar
+        self._sb_check_pending = None
         
         # Bind events to check scrollbar visibility
         self.tree.bind('<Configure>', self._check_scrollbar_visibility)
@@ -300,12 +1131,7 @@ class ProjectManagerGUI:
         ttk.Label(form_frame, text="💻 Language:", style='TLabel').grid(row=1, column=0, sticky=tk.W, padx=15, pady=10)
         self.language_var = tk.StringVar(value="python")
         language_combo = ttk.Combobox(form_frame, textvariable=self.language_var, 
-                                     values=["python", "javascript", "typescript", "java", "csharp", "cpp", "c", "go", "rust", 
-                                            "php", "ruby", "swift", "kotlin", "dart", "scala", "groovy", "haskell", "clojure",
-                                            "lua", "perl", "r", "julia", "nim", "zig", "v", "assembly",
-                                            "html", "css", "vue", "react", "angular", "svelte", "nextjs", "nuxt", "gatsby",
-                                            "bash", "powershell", "batch", "zsh", "fish",
-                                            "sql", "markdown", "json", "yaml", "xml"],
+                                     values=_LANGUAGE_CHOICES,
                                      state="readonly")
         language_combo.grid(row=1, column=1, padx=15, pady=10)
         
@@ -391,7 +1217,7 @@ class ProjectManagerGUI:
         monitor_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Monitoring thread
-        self.monitoring_thread = None
+        self.monitoring_after_id = None
         self.monitoring_running = False
     
     def create_settings_tab(self):
@@ -473,256 +1299,237 @@ class ProjectManagerGUI:
     
     def setup_styles(self):
         """Setup modern dark theme GUI styles"""
+        # Styles are global to the Tk interpreter, so configuring them once is enough
+        if getattr(self, '_styles_done', False):
+            return
+        self._styles_done = True
+        
         style = ttk.Style()
         style.theme_use('clam')
         
-        # Colors are already defined in __init__
-        
         # Configure main window
         self.root.configure(bg=self.colors['bg_primary'])
         
         # Configure styles with modern dark theme
-        style.configure('TLabel', 
-                       background=self.colors['bg_primary'],
-                       foreground=self.colors['text_primary'],
-                       font=('Segoe UI', 10))
-        
-        style.configure('Title.TLabel', 
-                       font=('Segoe UI', 18, 'bold'),
-                       foreground=self.colors['text_primary'],
-                       background=self.colors['bg_primary'])
-        
-        style.configure('Heading.TLabel', 
-                       font=('Segoe UI', 12, 'bold'),
-                       foreground=self.colors['text_primary'],
-                       background=self.colors['bg_primary'])
-        
-        style.configure('Status.TLabel', 
-                       font=('Segoe UI', 10),
-                       foreground=self.colors['text_secondary'],
-                       background=self.colors['bg_primary'])
-        
-        # Enhanced treeview with modern styling
-        style.configure('Treeview', 
-                       background=self.colors['bg_secondary'],
-                       foreground=self.colors['text_primary'],
-                       fieldbackground=self.colors['bg_secondary'],
-                       borderwidth=0,
-                       font=('Segoe UI', 10))
-        
-        style.configure('Treeview.Heading', 
-                       background=self.colors['bg_tertiary'],
-                       foreground=self.colors['text_primary'],
-                       font=('Segoe UI', 10, 'bold'),
-                       borderwidth=1,
-                       relief='flat')
-        
-        # Modern notebook styling
-        style.configure('TNotebook', 
-                       background=self.colors['bg_primary'],
-                       borderwidth=0)
-        
-        style.configure('TNotebook.Tab', 
-                       background=self.colors['bg_tertiary'],
-                       foreground=self.colors['text_secondary'],
-                       padding=[20, 12],
-                       font=('Segoe UI', 10, 'bold'),
-                       borderwidth=0)
-        
-        style.map('TNotebook.Tab', 
-                 background=[('selected', self.colors['accent']),
-                            ('active', self.colors['bg_secondary'])],
-                 foreground=[('selected', self.colors['text_primary']),
-                           ('active', self.colors['text_primary'])])
-        
-        # Modern button styling
-        style.configure('TButton', 
-                         background=self.colors['accent'],
-                         foreground=self.colors['text_primary'],
-                         font=('Segoe UI', 10, 'bold'),
-                         borderwidth=0,
-                         focuscolor='none',
-                         padding=[15, 8])
-        
-        style.map('TButton', 
-                 background=[('active', self.colors['accent_hover']),
-                           ('pressed', self.colors['accent'])])
-        
-        # Secondary button style
-        style.configure('Secondary.TButton',
-                       background=self.colors['bg_tertiary'],
-                       foreground=self.colors['text_primary'],
-                       font=('Segoe UI', 10),
-                       borderwidth=1,
-                       focuscolor='none',
-                       padding=[12, 6])
-        
-        style.map('Secondary.TButton',
-                 background=[('active', self.colors['bg_secondary']),
-                           ('pressed', self.colors['bg_tertiary'])])
-        
-        # Modern entry styling
-        style.configure('TEntry', 
-                       background=self.colors['bg_secondary'],
-                       foreground=self.colors['text_primary'],
-                       fieldbackground=self.colors['bg_secondary'],
-                       borderwidth=1,
-                       font=('Segoe UI', 10),
-                       insertcolor=self.colors['text_primary'])
-        
-        style.map('TEntry',
-                 fieldbackground=[('focus', self.colors['bg_tertiary'])])
-        
-        # Modern combobox styling
-        style.configure('TCombobox', 
-                       background=self.colors['bg_secondary'],
-                       foreground=self.colors['text_primary'],
-                       fieldbackground=self.colors['bg_secondary'],
-                       borderwidth=1,
-                       font=('Segoe UI', 10))
-        
-        # Frame styling
-        style.configure('TFrame', 
-                       background=self.colors['bg_primary'])
-        
-        style.configure('Card.TFrame',
-                       background=self.colors['bg_secondary'],
-                       relief='flat',
-                       borderwidth=1)
-        
-        # Label frame styling
-        style.configure('TLabelframe', 
-                       background=self.colors['bg_primary'],
-                       foreground=self.colors['text_primary'],
-                       borderwidth=1,
-                       relief='flat')
-        
-        style.configure('TLabelframe.Label', 
-                       background=self.colors['bg_primary'],
-                       foreground=self.colors['text_accent'],
-                       font=('Segoe UI', 11, 'bold'))
-        
-        # Progress bar styling
-        style.configure('TProgressbar',
-                       background=self.colors['accent'],
-                       troughcolor=self.colors['bg_tertiary'],
-                       borderwidth=0,
-                       lightcolor=self.colors['accent'],
-                       darkcolor=self.colors['accent'])
-        
-        # Scrollbar styling
-        style.configure('TScrollbar',
-                       background=self.colors['bg_tertiary'],
-                       troughcolor=self.colors['bg_secondary'],
-                       borderwidth=0,
-                       arrowcolor=self.colors['text_secondary'],
-                       darkcolor=self.colors['bg_tertiary'],
-                       lightcolor=self.colors['bg_tertiary'])
-        
-        style.map('TScrollbar',
-                 background=[('active', self.colors['bg_secondary'])])
+        for name, options in _STYLE_CONFIGURE:
+            style.configure(name, **options)
+        
+        for name, options in _STYLE_MAP:
+            style.map(name, **options)
     
     def load_projects(self):
         """Load projects from directory with caching support (optimized for large folders)"""
-        try:
-            projects_dir = Path(self.config["projects_dir"])
-            if not projects_dir.exists():
-                self.status_var.set(f"Projects directory does not exist: {projects_dir}")
-                self.projects = []
-                self.refresh_projects()
+        projects_dir = Path(self.config["projects_dir"])
+        
+        with self._load_lock:
+            if self._loading_projects:
+                # Rescan once the current scan finishes so new settings are picked up
+                self._reload_requested = True
                 return
-            
-            # Show loading status
-            self.status_var.set("Loading projects... Please wait")
-            self.root.update()  # Update GUI to show status
-            
-            # Load cache
-            cache = self._load_cache()
-            cache_hits = 0
-            cache_misses = 0
-            
-            self.projects = []
-            self.hierarchical_projects = {}  # Store hierarchical structure
-            
-            # Load projects with hierarchical detection and caching
-            print(f"Starting project scan in: {projects_dir}")
-            self._load_hierarchical_projects(projects_dir, parent_path=None, depth=0, cache=cache, cache_hits=cache_hits, cache_misses=cache_misses)
+            self._loading_projects = True
+            self._reload_requested = False
+        
+        # Tk variables may only be read on the main thread
+        queue_background = bool(getattr(self, 'background_processing_var', None) and self.background_processing_var.get())
+        
+        self.status_var.set("Loading projects... Please wait")
+        self._scan_projects = []
+        self._likely_project_memo.clear()
+        self._collection_memo.clear()
+        self._indicator_memo.clear()
+        threading.Thread(target=self._load_projects_worker,
+                         args=(projects_dir, queue_background), daemon=True).start()
+        self.root.after(50, self._drain_scan_queue)
+    
+    def _drain_scan_queue(self):
+        """Show projects streamed by the loader thread, a batch per tick, until the scan is done"""
+        found = []
+        while len(found) < 50:
+            try:
+                kind, payload = self._scan_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'done':
+                self._apply_projects_result(payload)
+                return
+            found.append(payload)
+        
+        if found:
+            if self.projects is not self._scan_projects:
+                # First results of this scan replace the previous listing
+                self.projects = self._scan_projects
+                self.loaded_items.clear()
+            self._scan_projects.extend(found)
+            self._schedule_refresh()
+            self.status_var.set(f"Loading projects... {len(self._scan_projects)} found")
+        
+        self.root.after(50, self._drain_scan_queue)
+    
+    def _load_projects_worker(self, projects_dir: Path, queue_background: bool):
+        """Scan the projects directory off the Tk main loop"""
+        scan = {
+            'projects_dir': projects_dir,
+            'projects': [],
+            'hierarchical_projects': {},
+            'background_queue': [],
+            'queue_background': queue_background,
+            'cache_hits': 0,
+            'cache_misses': 0,
+            'error': None,
+            'stream': self._scan_queue
+        }
+        try:
+            if projects_dir.exists():
+                # Load cache
+                cache = self._load_cache()
+                
+                # Load projects with hierarchical detection and caching
+                print(f"Starting project scan in: {projects_dir}")
+                self._load_hierarchical_projects(projects_dir, parent_path=None, depth=0, cache=cache, scan=scan)
+                
+                # Save updated cache
+                self._save_cache(cache)
+        except Exception as e:
+            scan['error'] = e
+        
+        self._scan_queue.put(('done', scan))
+    
+    def _apply_projects_result(self, scan: Dict):
+        """Show the results of a finished project scan"""
+        projects_dir = scan['projects_dir']
+        
+        with self._load_lock:
+            self._loading_projects = False
+            reload_requested = self._reload_requested
+        
+        self.projects = scan['projects']
+        self.hierarchical_projects = scan['hierarchical_projects']  # Store hierarchical structure
+        self.loaded_items.clear()
+        self.refresh_projects()
+        
+        if scan['error'] is not None:
+            error_msg = f"Error loading projects: {scan['error']}"
+            print(error_msg)
+            self.status_var.set(error_msg)
+        elif not projects_dir.exists():
+            self.status_var.set(f"Projects directory does not exist: {projects_dir}")
+        else:
             project_count = len(self.projects)
-            
-            # Save updated cache
-            self._save_cache(cache)
-            
-            self.refresh_projects()
+            cache_hits, cache_misses = scan['cache_hits'], scan['cache_misses']
             self.status_var.set(f"Loaded {project_count} projects (Cache: {cache_hits} hits, {cache_misses} misses) from {projects_dir}")
             print(f"Project loading completed. Found {project_count} projects. Cache: {cache_hits} hits, {cache_misses} misses")
             
             # Start background processing if queue has items
-            if self.background_queue:
-                self.start_background_processing()
-            
-        except Exception as e:
-            error_msg = f"Error loading projects: {e}"
-            print(error_msg)
-            self.status_var.set(error_msg)
-            self.projects = []
-            self.refresh_projects()
+            self._queue_background_analysis(scan['background_queue'])
+        
+        if reload_requested:
+            self.load_projects()
     
-    def start_background_processing(self):
-        """Start background processing of queued projects"""
-        if not self.processing_in_background and self.background_queue:
-            self.processing_in_background = True
-            self.status_var.set(f"Background processing {len(self.background_queue)} projects...")
-            self.process_background_batch()
-    
-    def process_background_batch(self):
-        """Process a small batch of projects in the background"""
-        if not self.background_queue or not self.processing_in_background:
-            self.processing_in_background = False
-            self.status_var.set("Background processing completed")
+    def _queue_background_analysis(self, project_paths: List[Path]):
+        """Hand projects to the background worker for full analysis"""
+        if not project_paths:
             return
+        self._queue_background_jobs(_analyze_project_worker, project_paths)
+    
+    def _queue_background_jobs(self, worker, project_paths: List[Path]):
+        """Queue (worker, path) jobs whose result dicts are merged into the projects"""
+        # Count before queueing; the worker may start draining immediately
+        pending = self.bg_q.qsize() + len(project_paths)
+        for project_path in project_paths:
+            self.bg_q.put((worker, project_path))
+        self.status_var.set(f"Background processing {pending} projects...")
+    
+    def _bg_worker(self):
+        """Drain the background queue in batches (runs on its own daemon thread)"""
+        while True:
+            # Block until there is work, then take whatever else is already waiting
+            batch = [self.bg_q.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.bg_q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            print(f"Processing background batch: {[project_path.name for _, project_path in batch]}")
+            executor = self._get_analysis_executor(len(batch))
+            futures = [(project_path, executor.submit(worker, str(project_path)))
+                       for worker, project_path in batch]
+            
+            results = []
+            for project_path, future in futures:
+                try:
+                    results.append((project_path, future.result(), None))
+                except Exception as e:
+                    results.append((project_path, None, e))
+            
+            self.root.after(0, self._apply_bg_results, results)
+    
+    def _get_analysis_executor(self, project_count: int):
+        """Return a reusable pool for full project analysis"""
+        # Spawning processes on Windows costs more than a handful of analyses saves
+        if sys.platform == 'win32' and project_count < 4:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(max_workers=4)
+            return self._thread_pool
         
-        # Process up to batch_size projects
-        batch = self.background_queue[:self.batch_size]
-        self.background_queue = self.background_queue[self.batch_size:]
-        
-        print(f"Processing background batch: {[p.name for p in batch]}")
-        
-        # Process each project in the batch
-        for project_path in batch:
+        if self._process_pool is None:
             try:
-                # Perform full analysis
-                project_info = self.analyze_project(project_path)
-                
-                # Update the project in the list
-                for i, project in enumerate(self.projects):
-                    if project.get('path') == str(project_path):
-                        self.projects[i].update(project_info)
-                        break
-                
-                # Update cache
-                cache = self._load_cache()
-                if cache is not None:
-                    self._cache_project(project_path, project_info, cache)
-                    self._save_cache(cache)
-                
-                print(f"  Background analysis completed: {project_path.name} - {project_info.get('health', 'N/A')}%")
-                
-            except Exception as e:
-                print(f"  Background analysis error for {project_path.name}: {e}")
+                # The GUI is already multithreaded, so start workers fresh rather than forking it
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    mp_context=multiprocessing.get_context('spawn'))
+            except (OSError, NotImplementedError) as e:
+                print(f"Process pool unavailable, analyzing in threads: {e}")
+                if self._thread_pool is None:
+                    self._thread_pool = ThreadPoolExecutor(max_workers=4)
+                return self._thread_pool
+        return self._process_pool
+    
+    def _apply_bg_results(self, results: List[tuple]):
+        """Apply a finished batch of background analyses to the project list"""
+        projects_by_path = {project.get('path'): project for project in self.projects}
+        to_cache = []
+        
+        for project_path, project_info, error in results:
+            if error is not None:
+                print(f"  Background analysis error for {project_path.name}: {error}")
+                continue
+            if not project_info:
+                continue
+            
+            # Update the project in the list; size-only jobs return a partial record,
+            # so cache the merged project rather than the result itself
+            project = projects_by_path.get(str(project_path))
+            if project is None:
+                continue
+            project.update(project_info)
+            
+            to_cache.append((project_path, dict(project)))
+            print(f"  Background analysis completed: {project_path.name} - {project.get('health', 'N/A')}%")
+        
+        # sqlite may wait on a loader's write lock, so keep it off the Tk thread
+        if to_cache:
+            self._cache_writer.submit(self._write_cache_entries, to_cache)
         
         # Update the GUI
-        self.refresh_projects()
+        self._schedule_refresh()
         
-        # Schedule next batch
-        if self.background_queue:
-            self.root.after(100, self.process_background_batch)  # 100ms delay between batches
+        remaining = self.bg_q.qsize()
+        if remaining:
+            self.status_var.set(f"Background processing {remaining} projects...")
         else:
-            self.processing_in_background = False
             self.status_var.set("Background processing completed")
             print("Background processing completed")
     
-    def _load_hierarchical_projects(self, base_path: Path, parent_path: Path = None, depth: int = 0, cache: Dict = None, cache_hits: int = 0, cache_misses: int = 0):
-        """Recursively load projects with hierarchical structure (ultra-optimized for large folders)"""
+    def _write_cache_entries(self, entries: List[tuple]):
+        """Store (project_path, project) pairs in the cache index (runs on the cache writer thread)"""
+        cache = self._load_cache()
+        for project_path, project in entries:
+            self._cache_project(project_path, project, cache)
+        self._save_cache(cache)
+    
+    def _load_hierarchical_projects(self, base_path: Path, parent_path: Path = None, depth: int = 0, cache: Dict = None, scan: Dict = None):
+        """Load one level of projects into the scan results (runs on a loader thread)"""
         if depth > 2:  # Allow deeper scanning for better hierarchy detection
             return
         
@@ -732,113 +1539,123 @@ class ProjectManagerGUI:
         
         try:
             # Get directory list and sort by name for consistent behavior
-            dirs = [d for d in base_path.iterdir() if d.is_dir() and not d.name.startswith('.')]
-            dirs.sort(key=lambda x: x.name.lower())
+            dirs = _subdirs(base_path)
+            dirs.sort(key=lambda entry: entry.name.lower())
             
-            for project_path in dirs:
+            candidates = []
+            for entry in dirs:
                 if dirs_scanned >= max_dirs_per_level:
                     print(f"Warning: Reached directory limit ({max_dirs_per_level}) at depth {depth}")
                     break
                     
                 dirs_scanned += 1
+                project_path = Path(entry.path)
                 
                 # Ultra-quick check for obvious non-project directories
                 if self._is_obvious_non_project(project_path):
                     print(f"Skipping obvious non-project: {project_path.name}")
                     continue
-                
-                # Update GUI periodically to prevent freezing
-                if dirs_scanned % 5 == 0:
-                    self.root.update_idletasks()
-                
+                candidates.append(project_path)
+            
+            # Cache lookups stay on this thread, the sqlite connection can't be shared with the pool
+            cached = {}
+            if cache is not None:
+                for project_path in candidates:
+                    cached[project_path] = self._get_cached_project(project_path, cache)
+            
+            # The per-directory checks are stat-bound, so overlap them on the scan pool
+            futures = [self._scan_pool.submit(self._probe_project_dir, project_path, base_path,
+                                              parent_path, depth, cached.get(project_path))
+                       for project_path in candidates]
+            
+            # Merge in directory order so the tree stays sorted
+            for project_path, future in zip(candidates, futures):
                 try:
-                    # Lightweight project check (no heavy analysis yet)
-                    print(f"Checking directory: {project_path.name}")
-                    if self._is_likely_project_directory(project_path):
-                        print(f"Found project: {project_path.name}")
-                        # Try to get from cache first
-                        project_info = None
-                        if cache is not None:
-                            project_info = self._get_cached_project(project_path, cache)
-                            if project_info:
-                                cache_hits += 1
-                                print(f"  Using cached data for {project_path.name}")
-                            else:
-                                print(f"  No cached data for {project_path.name}")
-                        
-                        # If not in cache, analyze the project
-                        if project_info is None:
-                            cache_misses += 1
-                            # Always use quick analysis for initial loading for speed
-                            project_info = self._quick_analyze_project(project_path)
-                            print(f"  Quick analysis for {project_path.name}")
-                            
-                            # Add to background queue for full analysis if enabled
-                            if getattr(self, 'background_processing_var', None) and self.background_processing_var.get():
-                                self.background_queue.append(project_path)
-                                print(f"  Queued for background analysis: {project_path.name}")
-                            
-                            # Cache the result
-                            if project_info and cache is not None:
-                                self._cache_project(project_path, project_info, cache)
-                        
-                        if project_info:
-                            # Smart parent detection
-                            detected_parent = self._detect_parent_project(project_path, base_path, parent_path)
-                            project_info['parent'] = detected_parent
-                            project_info['depth'] = depth
-                            project_info['path'] = str(project_path)
-                            project_info['relative_path'] = str(project_path.relative_to(Path(self.config["projects_dir"])))
-                            
-                            self.projects.append(project_info)
-                            
-                            # Store in hierarchical structure
-                            if detected_parent:
-                                parent_key = detected_parent
-                                if parent_key not in self.hierarchical_projects:
-                                    self.hierarchical_projects[parent_key] = []
-                                self.hierarchical_projects[parent_key].append(project_info)
-                            
-                            # Smart recursion: only recurse if project might contain sub-projects
-                            if self._might_contain_subprojects(project_path):
-                                print(f"  Recursively scanning for sub-projects: {project_path.name}")
-                                self._load_hierarchical_projects(project_path, project_path, depth + 1, cache, cache_hits, cache_misses)
-                        else:
-                            print(f"  Project info is None for {project_path.name}")
-                    
+                    project_info, analyzed = future.result()
                 except Exception as e:
                     print(f"Error analyzing project {project_path}: {e}")
                     continue
-                else:
-                    # If we get here, the directory was checked but not considered a project
+                
+                if project_info is None and not analyzed:
                     print(f"Directory not considered project: {project_path.name}")
+                    continue
+                
+                print(f"Found project: {project_path.name}")
+                if analyzed:
+                    scan['cache_misses'] += 1
+                    print(f"  Quick analysis for {project_path.name}")
+                    
+                    # Add to background queue for full analysis if enabled
+                    if scan['queue_background']:
+                        scan['background_queue'].append(project_path)
+                        print(f"  Queued for background analysis: {project_path.name}")
+                    
+                    # Cache the result
+                    if project_info and cache is not None:
+                        self._cache_project(project_path, project_info, cache)
+                else:
+                    scan['cache_hits'] += 1
+                
+                if not project_info:
+                    print(f"  Project info is None for {project_path.name}")
+                    continue
+                
+                project_info['depth'] = depth
+                project_info['path'] = str(project_path)
+                project_info['relative_path'] = str(project_path.relative_to(scan['projects_dir']))
+                
+                scan['projects'].append(project_info)
+                if scan.get('stream') is not None:
+                    scan['stream'].put(('project', project_info))
+                
+                # Store in hierarchical structure
+                detected_parent = project_info['parent']
+                if detected_parent:
+                    scan['hierarchical_projects'].setdefault(detected_parent, []).append(project_info)
                     
         except PermissionError:
             print(f"Permission denied accessing {base_path}")
         except Exception as e:
             print(f"Error scanning directory {base_path}: {e}")
     
+    def _probe_project_dir(self, project_path: Path, base_path: Path, parent_path: Optional[Path],
+                           depth: int, cached_info: Optional[Dict]) -> tuple:
+        """Check one candidate directory and quick-analyze it on a cache miss (runs on the scan pool)"""
+        # Lightweight project check (no heavy analysis yet)
+        if not self._is_likely_project_directory(project_path):
+            return None, False
+        
+        project_info = cached_info
+        analyzed = project_info is None
+        if analyzed:
+            # Always use quick analysis for initial loading for speed
+            project_info = self._quick_analyze_project(project_path)
+        
+        if project_info:
+            # Smart parent detection
+            project_info['parent'] = self._detect_parent_project(project_path, base_path, parent_path)
+            # Sub-projects are scanned lazily when the project is expanded in the tree
+            project_info['has_subprojects'] = depth < 2 and self._might_contain_subprojects(project_path)
+        return project_info, analyzed
+    
     def _is_likely_project_directory(self, project_path: Path) -> bool:
-        """Enhanced project detection including collection folders"""
-        # Check for obvious project indicators
-        quick_indicators = [
-            'package.json', 'requirements.txt', 'Cargo.toml', 'go.mod', 'pom.xml',
-            'composer.json', 'Gemfile', 'setup.py', 'README.md'
-        ]
-        
-        for indicator in quick_indicators:
-            if (project_path / indicator).exists():
-                return True
-        
-        # Check for common source directories
-        for src_dir in ['src', 'lib', 'app']:
-            if (project_path / src_dir).exists():
-                return True
+        """Enhanced project detection including collection folders, memoized until the next full scan"""
+        key = str(project_path)
+        result = self._likely_project_memo.get(key)
+        if result is None:
+            result = self._likely_project_memo[key] = self._check_likely_project_directory(project_path)
+        return result
+    
+    def _check_likely_project_directory(self, project_path: Path) -> bool:
+        """Uncached body of _is_likely_project_directory"""
+        # Check for obvious project indicators and common source directories
+        names = _dir_names(project_path)
+        if not names.isdisjoint(PROJECT_INDICATORS):
+            return True
         
         # Check for language files
-        for ext in ['.py', '.js', '.ts', '.java', '.cpp', '.c']:
-            if list(project_path.glob(f'*{ext}')):
-                return True
+        if any(os.path.splitext(name)[1] in _LIKELY_PROJECT_EXTS for name in names):
+            return True
         
         # NEW: Check for collection folders (folders containing multiple sub-projects)
         if self._is_collection_folder(project_path):
@@ -847,22 +1664,34 @@ class ProjectManagerGUI:
         return False
     
     def _is_collection_folder(self, project_path: Path) -> bool:
-        """Check if a folder is a collection of projects (like Tools, Projects, etc.)"""
+        """Check if a folder is a collection of projects (like Tools, Projects, etc.), memoized until the next full scan"""
+        key = str(project_path)
+        result = self._collection_memo.get(key)
+        if result is None:
+            result = self._collection_memo[key] = self._check_collection_folder(project_path)
+        return result
+    
+    def _check_collection_folder(self, project_path: Path) -> bool:
+        """Uncached body of _is_collection_folder"""
         try:
             # Count subdirectories that look like projects
-            subdirs = [d for d in project_path.iterdir() if d.is_dir() and not d.name.startswith('.')]
+            subdirs = _subdirs(project_path)
             
             if len(subdirs) < 3:  # Need at least 3 subdirectories to be considered a collection
                 return False
             
-            # Count how many subdirectories look like projects
+            # If at least half of subdirectories look like projects, it's a collection folder;
+            # stop as soon as the answer can't change
+            needed = (len(subdirs) + 1) // 2
             project_like_count = 0
-            for subdir in subdirs:
-                if self._has_project_indicators(subdir):
+            for checked, subdir in enumerate(subdirs, 1):
+                if self._has_project_indicators(subdir.path):
                     project_like_count += 1
-            
-            # If more than half of subdirectories look like projects, it's a collection folder
-            return project_like_count >= len(subdirs) * 0.5
+                    if project_like_count >= needed:
+                        return True
+                elif project_like_count + len(subdirs) - checked < needed:
+                    return False
+            return False
             
         except Exception:
             return False
@@ -871,13 +1700,17 @@ class ProjectManagerGUI:
         """Quick project analysis without heavy computation"""
         try:
             name = project_path.name
-            size = self.get_directory_size(project_path)
+            tree_stats = _scan_tree(project_path, limit=SIZE_SCAN_FILE_LIMIT,
+                                    deadline=time.monotonic() + QUICK_SCAN_SECONDS)
+            size = self._format_tree_stats_size(tree_stats)
+            modified = (time.strftime('%Y-%m-%d', time.localtime(tree_stats.mtime_ns // 1_000_000_000))
+                        if tree_stats.file_count else 'Unknown')
             
             # Check if this is a collection folder
             if self._is_collection_folder(project_path):
                 # Count sub-projects for collection folders
-                subdirs = [d for d in project_path.iterdir() if d.is_dir() and not d.name.startswith('.')]
-                project_count = len([d for d in subdirs if self._has_project_indicators(d)])
+                subdirs = _subdirs(project_path)
+                project_count = len([d for d in subdirs if self._has_project_indicators(d.path)])
                 
                 return {
                     'name': name,
@@ -892,7 +1725,7 @@ class ProjectManagerGUI:
                 }
             else:
                 # Quick project type detection
-                project_type, language, framework = self._quick_detect_project_type(project_path)
+                project_type, language, framework = self._quick_detect_project_type(_dir_names(project_path))
                 
                 # Simple health score (no heavy analysis)
                 health_score = 50  # Default score, will be calculated later if needed
@@ -906,81 +1739,52 @@ class ProjectManagerGUI:
                     'health': health_score,
                     'size': size,
                     'status': 'Unknown',
-                    'modified': 'Unknown'
+                    'modified': modified
                 }
         except Exception as e:
             print(f"Error in quick analysis of {project_path}: {e}")
             return None
     
-    def _quick_detect_project_type(self, project_path: Path) -> tuple:
-        """Quick project type detection without heavy file scanning"""
-        # Check for obvious indicators
-        if (project_path / 'package.json').exists():
-            return ('nodejs', 'javascript', 'node')
-        elif (project_path / 'requirements.txt').exists() or (project_path / 'setup.py').exists():
-            return ('python', 'python', 'flask')
-        elif (project_path / 'Cargo.toml').exists():
-            return ('rust', 'rust', 'cargo')
-        elif (project_path / 'go.mod').exists():
-            return ('go', 'go', 'go')
-        elif (project_path / 'pom.xml').exists():
-            return ('java', 'java', 'maven')
-        elif (project_path / 'composer.json').exists():
-            return ('php', 'php', 'composer')
-        elif (project_path / 'Gemfile').exists():
-            return ('ruby', 'ruby', 'bundler')
-        else:
-            return ('generic', 'unknown', 'unknown')
+    def _quick_detect_project_type(self, names: frozenset) -> tuple:
+        """Quick project type detection from a directory's cached listing, without file scanning"""
+        # Only the manifests matter, so projects of the same shape share one cached answer
+        return _quick_project_type(names & _QUICK_TYPE_MANIFESTS)
     
     def _is_obvious_monorepo(self, project_path: Path) -> bool:
         """Quick check for obvious monorepo structure"""
-        monorepo_indicators = ['packages', 'apps', 'services', 'modules', 'libs']
-        for indicator in monorepo_indicators:
-            if (project_path / indicator).exists():
-                return True
-        return False
+        return not _dir_names(project_path).isdisjoint(OBVIOUS_MONOREPO_DIRS)
     
     def _is_obvious_non_project(self, project_path: Path) -> bool:
         """Quick check for obvious non-project directories to skip early"""
-        obvious_non_projects = {
-            # Common non-project folders
-            'node_modules', 'venv', 'env', '.venv', '.env', '__pycache__',
-            'target', 'build', 'dist', 'out', 'bin', 'obj', 'classes',
-            '.git', '.svn', '.hg', '.bzr', '.vscode', '.idea', '.vs',
-            'tmp', 'temp', 'cache', '.cache', 'logs', '.logs',
-            '.next', '.nuxt', '.gatsby', '.svelte-kit', '.astro',
-            'public', 'static', 'assets', 'media', 'docs', 'documentation'
-        }
-        
-        return project_path.name.lower() in obvious_non_projects
+        return project_path.name.lower() in OBVIOUS_NON_PROJECTS
     
     def _should_recurse_into_project(self, project_path: Path) -> bool:
         """Determine if we should recurse into a project directory"""
-        # Don't recurse into obvious single-purpose projects
-        single_purpose_indicators = [
-            'package.json', 'requirements.txt', 'Cargo.toml', 'go.mod', 'pom.xml'
-        ]
-        
-        # If it has a clear package manager, it's likely a single project
-        for indicator in single_purpose_indicators:
-            if (project_path / indicator).exists():
-                return False
+        # Don't recurse into obvious single-purpose projects:
+        # if it has a clear package manager, it's likely a single project
+        names = _dir_names(project_path)
+        if not names.isdisjoint(SINGLE_PROJECT_MANIFESTS):
+            return False
         
         # Only recurse if it looks like a monorepo or multi-project structure
-        monorepo_indicators = ['packages', 'apps', 'services', 'modules', 'libs', 'components']
-        for indicator in monorepo_indicators:
-            if (project_path / indicator).exists():
-                return True
-        
-        # Check for multiple package.json files (monorepo)
-        package_json_count = len(list(project_path.rglob('package.json')))
-        if package_json_count > 1:
+        if not names.isdisjoint(MONOREPO_DIRS):
             return True
         
-        # Check for multiple language files in subdirectories
-        language_files = list(project_path.rglob('*.py')) + list(project_path.rglob('*.js')) + list(project_path.rglob('*.ts'))
-        if len(language_files) > 10:  # Likely a monorepo
-            return True
+        # One lazy walk for both monorepo hints, stopping as soon as either threshold is hit
+        package_json_count = 0
+        language_file_count = 0
+        for entry in _iter_files(project_path):
+            name = entry.name
+            if name == 'package.json':
+                package_json_count += 1
+                # Multiple package.json files (monorepo)
+                if package_json_count > 1:
+                    return True
+            if name.endswith(('.py', '.js', '.ts')):
+                language_file_count += 1
+                # Many language files in subdirectories
+                if language_file_count > 10:  # Likely a monorepo
+                    return True
         
         return False
     
@@ -1005,156 +1809,106 @@ class ProjectManagerGUI:
     
     def _might_contain_subprojects(self, project_path: Path) -> bool:
         """Check if a project might contain sub-projects"""
+        # On Unix a directory's link count is 2 plus its subdirectory count (filesystems that
+        # don't track it report 1), so a count of 2 leaves only the workspace files to check
+        if sys.platform != 'win32':
+            try:
+                nlink = os.stat(project_path).st_nlink
+            except OSError:
+                nlink = 0
+            if nlink == 2:
+                return not _dir_names(project_path).isdisjoint(WORKSPACE_FILES)
+        
         # First check if this is a collection folder
         if self._is_collection_folder(project_path):
             return True
         
         # Check for common sub-project indicators
-        subproject_indicators = [
-            'packages', 'apps', 'libs', 'services', 'modules', 'components',
-            'src', 'lib', 'app', 'client', 'server', 'frontend', 'backend'
-        ]
-        
-        for indicator in subproject_indicators:
-            if (project_path / indicator).exists():
-                # Check if the subdirectory contains projects
-                subdir = project_path / indicator
-                if subdir.is_dir():
-                    # Quick check for project files in subdirectory
-                    for item in subdir.iterdir():
-                        if item.is_dir() and not item.name.startswith('.'):
-                            # Check if this subdirectory looks like a project
-                            if self._has_project_indicators(item):
-                                return True
+        names = _dir_names(project_path)
+        for indicator in names & SUBPROJECT_DIRS:
+            # Check if the subdirectory contains projects
+            subdir = os.path.join(project_path, indicator)
+            if os.path.isdir(subdir):
+                # Quick check for project files in subdirectory
+                for item in _subdirs(subdir):
+                    # Check if this subdirectory looks like a project
+                    if self._has_project_indicators(item.path):
+                        return True
         
         # Check for workspace/monorepo files
-        workspace_files = ['package.json', 'lerna.json', 'nx.json', 'rush.json']
-        for file in workspace_files:
-            if (project_path / file).exists():
-                return True
-        
-        return False
+        return not names.isdisjoint(WORKSPACE_FILES)
     
-    def _has_project_indicators(self, path: Path) -> bool:
-        """Quick check if a path has project indicators"""
-        indicators = [
-            'package.json', 'requirements.txt', 'Cargo.toml', 'go.mod', 'pom.xml',
-            'composer.json', 'Gemfile', 'setup.py', 'README.md', 'src', 'lib', 'app'
-        ]
-        
-        for indicator in indicators:
-            if (path / indicator).exists():
-                return True
-        
-        return False
+    def _has_project_indicators(self, path) -> bool:
+        """Quick check if a path (str or Path) has project indicators, memoized until the next full scan"""
+        key = os.fspath(path)
+        result = self._indicator_memo.get(key)
+        if result is None:
+            result = self._indicator_memo[key] = not _dir_names(path).isdisjoint(PROJECT_INDICATORS)
+        return result
     
     def _is_project_directory(self, project_path: Path) -> bool:
         """Check if a directory is a project (has project indicators)"""
-        # Exclude framework-generated folders and common non-project directories
-        excluded_folders = {
-            # Node.js frameworks
-            'node_modules', '.next', '.nuxt', '.vuepress', '.docusaurus',
-            'dist', 'build', 'out', '.output', '.vercel', '.netlify',
-            
-            # Python frameworks
-            '__pycache__', '.pytest_cache', '.mypy_cache', 'venv', 'env',
-            '.venv', '.env', 'site-packages', 'egg-info',
-            
-            # Java frameworks
-            'target', '.gradle', '.mvn', 'bin', 'classes',
-            
-            # Build outputs
-            'build', 'dist', 'out', 'target', 'bin', 'obj',
-            
-            # IDE and editor folders
-            '.vscode', '.idea', '.vs', '.eclipse', '.settings',
-            
-            # Version control
-            '.git', '.svn', '.hg', '.bzr',
-            
-            # OS folders
-            '.DS_Store', 'Thumbs.db', '.Trash',
-            
-            # Temporary folders
-            'tmp', 'temp', 'cache', '.cache', 'logs', '.logs',
-            
-            # Framework-specific
-            '.next', '.nuxt', '.gatsby', '.svelte-kit', '.astro',
-            'public', 'static', 'assets', 'media'
-        }
-        
-        # Skip excluded folders
-        if project_path.name.lower() in excluded_folders:
+        # Skip framework-generated folders and common non-project directories
+        if project_path.name.lower() in EXCLUDED_FOLDERS:
             return False
         
         # Skip hidden folders (except .git for git repos)
         if project_path.name.startswith('.') and project_path.name != '.git':
             return False
         
-        project_indicators = [
-            # Package managers
-            'package.json', 'requirements.txt', 'Cargo.toml', 'go.mod', 'pom.xml',
-            'composer.json', 'Gemfile', 'setup.py', 'pyproject.toml',
-            
-            # Build files
-            'Makefile', 'CMakeLists.txt', 'build.gradle', 'build.xml',
-            
-            # Configuration files
-            'Dockerfile', 'docker-compose.yml', '.gitignore', 'README.md',
-            
-            # Source directories
-            'src', 'lib', 'app', 'source', 'code'
-        ]
-        
-        # Check for package managers and build files
-        for indicator in project_indicators[:10]:  # Package managers and build files
-            if (project_path / indicator).exists():
-                return True
-        
-        # Check for source directories
-        for src_dir in ['src', 'lib', 'app', 'source', 'code']:
-            if (project_path / src_dir).exists():
-                return True
+        # Check for package managers, build files and source directories
+        names = _dir_names(project_path)
+        if not names.isdisjoint(PROJECT_MANIFESTS) or not names.isdisjoint(PROJECT_SRC_DIRS):
+            return True
         
         # Check for language files (but exclude common framework files)
-        framework_files = {
-            'next.config.js', 'nuxt.config.js', 'vue.config.js', 'svelte.config.js',
-            'tailwind.config.js', 'postcss.config.js', 'babel.config.js',
-            'webpack.config.js', 'rollup.config.js', 'vite.config.js',
-            'jest.config.js', 'cypress.config.js', 'playwright.config.js'
-        }
-        
-        for ext in ['.py', '.js', '.ts', '.java', '.cpp', '.c', '.go', '.rs', '.php', '.rb', '.swift', '.kt', '.dart', '.sh']:
-            files = list(project_path.glob(f'*{ext}'))
-            # Filter out framework config files
-            actual_source_files = [f for f in files if f.name not in framework_files]
-            if actual_source_files:
+        for name in names:
+            if os.path.splitext(name)[1] in _PROJECT_SOURCE_EXTS and name not in _FRAMEWORK_CONFIG_FILES:
                 return True
         
         # Check for README or .git (common project indicators)
-        if (project_path / 'README.md').exists() or (project_path / '.git').exists():
+        if 'README.md' in names or '.git' in names:
             return True
         
         return False
     
     def clear_cache(self):
         """Clear the project cache"""
+        if not self.cache_file.exists():
+            messagebox.showinfo("Cache Cleared", "No cache file found.")
+            return
+        self.status_var.set("🧹 Clearing cache...")
+        self._cache_writer.submit(self._clear_cache_worker)
+    
+    def _clear_cache_worker(self):
+        """Empty the cache index (runs on the cache writer thread)"""
         try:
-            if self.cache_file.exists():
-                self.cache_file.unlink()
-                messagebox.showinfo("Cache Cleared", "Project cache has been cleared successfully.")
-                print("Cache cleared successfully")
-            else:
-                messagebox.showinfo("Cache Cleared", "No cache file found.")
+            # Empty the table rather than unlinking, a loader thread may have the index open
+            cache = self._load_cache()
+            cache.execute('DELETE FROM proj')
+            self._save_cache(cache)
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to clear cache: {e}")
             print(f"Error clearing cache: {e}")
+            self.root.after(0, self._report_cache_cleared, e)
+            return
+        print("Cache cleared successfully")
+        self.root.after(0, self._report_cache_cleared, None)
+    
+    def _report_cache_cleared(self, error: Optional[Exception]):
+        """Tell the user how clearing the cache went"""
+        if error is not None:
+            self.status_var.set("🟢 Ready")
+            messagebox.showerror("Error", f"Failed to clear cache: {error}")
+        else:
+            self.status_var.set("✅ Cache cleared")
+            messagebox.showinfo("Cache Cleared", "Project cache has been cleared successfully.")
     
     def show_cache_info(self):
         """Show cache information"""
         try:
             cache = self._load_cache()
-            cache_size = len(cache)
+            cache_size = cache.execute('SELECT COUNT(*) FROM proj').fetchone()[0]
+            self._save_cache(cache)
             cache_file_size = 0
             if self.cache_file.exists():
                 cache_file_size = self.cache_file.stat().st_size
@@ -1171,71 +1925,74 @@ class ProjectManagerGUI:
             messagebox.showerror("Error", f"Failed to get cache info: {e}")
             print(f"Error getting cache info: {e}")
     
-    def _get_cache_key(self, project_path: Path) -> str:
-        """Generate a cache key for a project based on its path and modification time"""
-        try:
-            # Get the most recent modification time of key files
-            key_files = ['package.json', 'requirements.txt', 'Cargo.toml', 'go.mod', 'pom.xml', 
-                        'composer.json', 'Gemfile', 'setup.py', 'pyproject.toml', 'README.md']
-            
-            max_mtime = 0
-            for key_file in key_files:
-                file_path = project_path / key_file
-                if file_path.exists():
-                    max_mtime = max(max_mtime, file_path.stat().st_mtime)
-            
-            # If no key files, use directory modification time
-            if max_mtime == 0:
-                max_mtime = project_path.stat().st_mtime
-            
-            # Create hash from path and modification time
-            cache_string = f"{project_path}_{max_mtime}"
-            return hashlib.md5(cache_string.encode()).hexdigest()
-        except:
-            # Fallback to path hash
-            return hashlib.md5(str(project_path).encode()).hexdigest()
+    def _get_cache_stamp(self, project_path: Path) -> tuple:
+        """Return the (root mtime_ns, newest key-file mtime_ns) used to validate a project's cache entry"""
+        # Editing a manifest in place doesn't touch the directory's mtime, so check those too,
+        # reading them off one scandir pass instead of an exists()+stat() per name
+        key_mtime_ns = 0
+        with os.scandir(project_path) as entries:
+            for entry in entries:
+                if entry.name in _CACHE_KEY_FILES:
+                    try:
+                        key_mtime_ns = max(key_mtime_ns, entry.stat().st_mtime_ns)
+                    except OSError:  # dangling symlink or removed mid-scan
+                        continue
+        return os.stat(project_path).st_mtime_ns, key_mtime_ns
     
-    def _load_cache(self) -> Dict:
-        """Load project cache from disk"""
+    def _load_cache(self) -> sqlite3.Connection:
+        """Open the project cache index for the calling thread"""
         try:
-            if self.cache_file.exists():
-                with open(self.cache_file, 'rb') as f:
-                    cache = pickle.load(f)
-                    print(f"Loaded cache with {len(cache)} entries")
-                    return cache
-        except Exception as e:
+            # Autocommit: each write is its own short transaction, so no thread holds the write lock for a whole scan
+            db = sqlite3.connect(self.cache_file, timeout=10, isolation_level=None)
+            # WAL lets the loader threads read while another one is writing
+            db.execute('PRAGMA journal_mode=WAL')
+            if db.execute('PRAGMA user_version').fetchone()[0] != CACHE_VERSION:
+                db.execute('DROP TABLE IF EXISTS proj')
+                db.execute(f'PRAGMA user_version = {CACHE_VERSION}')
+        except sqlite3.Error as e:
             print(f"Error loading cache: {e}")
-        return {}
+            db = sqlite3.connect(':memory:', isolation_level=None)
+        db.execute('CREATE TABLE IF NOT EXISTS proj(path TEXT PRIMARY KEY, mtime_ns INT, key_mtime_ns INT, blob BLOB)')
+        return db
     
-    def _save_cache(self, cache: Dict):
-        """Save project cache to disk"""
+    def _save_cache(self, cache: sqlite3.Connection):
+        """Close the cache index; writes are committed as they are made"""
         try:
-            with open(self.cache_file, 'wb') as f:
-                pickle.dump(cache, f)
-                print(f"Saved cache with {len(cache)} entries")
-        except Exception as e:
+            cache.commit()
+        except sqlite3.Error as e:
             print(f"Error saving cache: {e}")
+        finally:
+            cache.close()
     
-    def _get_cached_project(self, project_path: Path, cache: Dict) -> Optional[Dict]:
+    def _get_cached_project(self, project_path: Path, cache: sqlite3.Connection) -> Optional[Dict]:
         """Get cached project data if available and valid"""
-        cache_key = self._get_cache_key(project_path)
-        if cache_key in cache:
-            cached_data = cache[cache_key]
-            # Check if the project still exists and hasn't been modified
-            if project_path.exists():
-                try:
-                    current_key = self._get_cache_key(project_path)
-                    if current_key == cache_key:
-                        print(f"Using cached data for {project_path.name}")
-                        return cached_data
-                except:
-                    pass
+        try:
+            row = cache.execute('SELECT mtime_ns, key_mtime_ns, blob FROM proj WHERE path = ?',
+                                (str(project_path),)).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error reading cache for {project_path.name}: {e}")
+            return None
+        if row is None:
+            return None
+        try:
+            mtime_ns, key_mtime_ns = self._get_cache_stamp(project_path)
+        except OSError:
+            return None
+        # Only reuse the record if the project root hasn't changed since it was cached
+        if row[0] == mtime_ns and row[1] == key_mtime_ns:
+            print(f"Using cached data for {project_path.name}")
+            return json.loads(row[2])
         return None
     
-    def _cache_project(self, project_path: Path, project_data: Dict, cache: Dict):
+    def _cache_project(self, project_path: Path, project_data: Dict, cache: sqlite3.Connection):
         """Cache project data"""
-        cache_key = self._get_cache_key(project_path)
-        cache[cache_key] = project_data
+        try:
+            mtime_ns, key_mtime_ns = self._get_cache_stamp(project_path)
+            cache.execute('INSERT OR REPLACE INTO proj(path, mtime_ns, key_mtime_ns, blob) VALUES (?, ?, ?, ?)',
+                          (str(project_path), mtime_ns, key_mtime_ns, json.dumps(project_data)))
+        except (OSError, sqlite3.Error) as e:
+            print(f"Error caching {project_path.name}: {e}")
+            return
         print(f"Cached data for {project_path.name}")
     
     def analyze_project(self, project_path: Path) -> Optional[Dict]:
@@ -1244,8 +2001,12 @@ class ProjectManagerGUI:
             name = project_path.name
             path = str(project_path)
             
+            # One walk feeds the language, size and health checks below
+            recent_since_ns = time.time_ns() - _RECENT_WINDOW_NS
+            project_scan = _scan_project(project_path, recent_since_ns)
+            
             # Detect project type
-            project_type, language, framework = self.detect_project_type(project_path)
+            project_type, language, framework = self.detect_project_type(project_path, project_scan)
             
             # Detect JavaScript frameworks specifically
             js_frameworks = self._detect_js_frameworks(project_path)
@@ -1269,14 +2030,14 @@ class ProjectManagerGUI:
             
             # Get file stats
             stat = project_path.stat()
-            last_modified = datetime.datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d')
-            size = self.get_directory_size(project_path)
+            last_modified = time.strftime('%Y-%m-%d', time.localtime(stat.st_mtime))
+            size = self._format_tree_stats_size(project_scan.stats)
             
             # Calculate health score
-            health_score = self.calculate_health_score(project_path, language)
+            health_score = self.calculate_health_score(project_path, language, project_scan)
             
             # Get project status
-            status = self.get_project_status(project_path)
+            status = self.get_project_status(stat)
             
             return {
                 'name': name,
@@ -1294,197 +2055,11 @@ class ProjectManagerGUI:
             print(f"Error analyzing project {project_path}: {e}")
             return None
     
-    def _detect_languages(self, project_path: Path) -> list:
+    def _detect_languages(self, project_path: Path, project_scan: Optional[ProjectScan] = None) -> list:
         """Detect all programming languages in a project"""
-        languages = []
-        
-        # Comprehensive file extension to language mapping
-        lang_extensions = {
-            # Python ecosystem
-            '.py': 'python', '.pyi': 'python', '.pyc': 'python', '.pyo': 'python',
-            
-            # JavaScript/TypeScript ecosystem
-            '.js': 'javascript', '.jsx': 'javascript', '.mjs': 'javascript',
-            '.ts': 'typescript', '.tsx': 'typescript', '.d.ts': 'typescript',
-            
-            # Java ecosystem
-            '.java': 'java', '.kt': 'kotlin', '.scala': 'scala', '.groovy': 'groovy',
-            '.jsp': 'jsp', '.jspx': 'jsp',
-            
-            # C/C++ ecosystem
-            '.c': 'c', '.h': 'c', '.cpp': 'cpp', '.cxx': 'cpp', '.cc': 'cpp',
-            '.hpp': 'cpp', '.hxx': 'cpp', '.h++': 'cpp', '.c++': 'cpp',
-            
-            # C# ecosystem
-            '.cs': 'csharp', '.csx': 'csharp',
-            
-            # Go
-            '.go': 'go',
-            
-            # Rust
-            '.rs': 'rust',
-            
-            # PHP
-            '.php': 'php', '.phtml': 'php', '.php3': 'php', '.php4': 'php', '.php5': 'php',
-            
-            # Ruby
-            '.rb': 'ruby', '.rbw': 'ruby', '.rake': 'ruby',
-            
-            # Shell scripting
-            '.sh': 'bash', '.bash': 'bash', '.zsh': 'zsh', '.fish': 'fish',
-            '.ps1': 'powershell', '.psm1': 'powershell', '.psd1': 'powershell',
-            '.bat': 'batch', '.cmd': 'batch',
-            
-            # Web technologies
-            '.html': 'html', '.htm': 'html', '.xhtml': 'html',
-            '.css': 'css', '.scss': 'scss', '.sass': 'sass', '.less': 'less',
-            '.xml': 'xml', '.svg': 'svg',
-            
-            # Data formats
-            '.json': 'json', '.yaml': 'yaml', '.yml': 'yaml', '.toml': 'toml',
-            '.ini': 'ini', '.cfg': 'config', '.conf': 'config',
-            
-            # Database
-            '.sql': 'sql', '.sqlite': 'sqlite', '.db': 'database',
-            
-            # Documentation
-            '.md': 'markdown', '.rst': 'restructuredtext', '.tex': 'latex',
-            '.txt': 'text', '.log': 'log',
-            
-            # Mobile development
-            '.swift': 'swift', '.m': 'objective-c', '.mm': 'objective-c++',
-            '.dart': 'dart', '.java': 'java',  # Android
-            
-            # Functional languages
-            '.hs': 'haskell', '.elm': 'elm', '.fs': 'fsharp', '.fsx': 'fsharp',
-            '.clj': 'clojure', '.cljs': 'clojurescript',
-            
-            # Scripting languages
-            '.lua': 'lua', '.pl': 'perl', '.pm': 'perl',
-            '.r': 'r', '.R': 'r',
-            '.jl': 'julia',
-            
-            # System languages
-            '.asm': 'assembly', '.s': 'assembly',
-            '.nim': 'nim', '.zig': 'zig', '.v': 'v',
-            
-            # Web frameworks and tools
-            '.vue': 'vue', '.svelte': 'svelte',
-            '.jsx': 'react', '.tsx': 'react',
-            '.angular': 'angular',
-            
-            # Configuration and build
-            '.dockerfile': 'dockerfile', '.makefile': 'makefile',
-            '.cmake': 'cmake', '.gradle': 'gradle',
-            '.maven': 'maven', '.ant': 'ant',
-            
-            # Other
-            '.shader': 'shader', '.glsl': 'glsl', '.hlsl': 'hlsl',
-            '.proto': 'protobuf', '.thrift': 'thrift',
-            '.graphql': 'graphql', '.gql': 'graphql'
-        }
-        
-        # Check all files for language indicators
-        for file_path in project_path.rglob('*'):
-            if file_path.is_file():
-                # Check file extension
-                if file_path.suffix.lower() in lang_extensions:
-                    lang = lang_extensions[file_path.suffix.lower()]
-                    if lang not in languages:
-                        languages.append(lang)
-                
-                # Check for specific configuration files and frameworks
-                config_files = {
-                    # JavaScript/Node.js ecosystem
-                    'package.json': 'javascript', 'yarn.lock': 'javascript', 'package-lock.json': 'javascript',
-                    'webpack.config.js': 'javascript', 'rollup.config.js': 'javascript',
-                    'vite.config.js': 'javascript', 'next.config.js': 'nextjs',
-                    'nuxt.config.js': 'nuxt', 'nuxt.config.ts': 'nuxt',
-                    'vue.config.js': 'vue', 'vue.config.ts': 'vue',
-                    'angular.json': 'angular', 'angular-cli.json': 'angular',
-                    'svelte.config.js': 'svelte', 'svelte.config.cjs': 'svelte', 'svelte.config.ts': 'svelte',
-                    'remix.config.js': 'remix', 'remix.config.ts': 'remix',
-                    'astro.config.js': 'astro', 'astro.config.mjs': 'astro', 'astro.config.ts': 'astro',
-                    'gatsby-config.js': 'gatsby', 'gatsby-config.ts': 'gatsby',
-                    'sanity.config.js': 'sanity', 'sanity.config.ts': 'sanity',
-                    'tailwind.config.js': 'tailwind', 'tailwind.config.ts': 'tailwind',
-                    'postcss.config.js': 'postcss', 'postcss.config.ts': 'postcss',
-                    'babel.config.js': 'babel', 'babel.config.json': 'babel',
-                    'jest.config.js': 'jest', 'jest.config.ts': 'jest',
-                    'cypress.config.js': 'cypress', 'cypress.config.ts': 'cypress',
-                    'playwright.config.js': 'playwright', 'playwright.config.ts': 'playwright',
-                    'vitest.config.js': 'vitest', 'vitest.config.ts': 'vitest',
-                    'eslint.config.js': 'eslint', 'eslint.config.mjs': 'eslint',
-                    'prettier.config.js': 'prettier', 'prettier.config.json': 'prettier',
-                    'tsconfig.json': 'typescript', 'jsconfig.json': 'javascript',
-                    'turborepo.json': 'turborepo', 'nx.json': 'nx',
-                    'lerna.json': 'lerna', 'rush.json': 'rush',
-                    
-                    # Python ecosystem
-                    'requirements.txt': 'python', 'pyproject.toml': 'python', 'setup.py': 'python',
-                    'Pipfile': 'python', 'poetry.lock': 'python', 'conda.yml': 'python',
-                    'Django': 'django', 'Flask': 'flask', 'FastAPI': 'fastapi',
-                    
-                    # Java ecosystem
-                    'pom.xml': 'java', 'build.gradle': 'java', 'build.gradle.kts': 'java',
-                    'gradle.properties': 'java', 'settings.gradle': 'java',
-                    'spring-boot': 'spring', 'maven': 'maven',
-                    
-                    # C# ecosystem
-                    '*.csproj': 'csharp', '*.sln': 'csharp', '*.vbproj': 'vbnet',
-                    'project.json': 'csharp', 'global.json': 'csharp',
-                    
-                    # Go
-                    'go.mod': 'go', 'go.sum': 'go', 'Gopkg.toml': 'go',
-                    
-                    # Rust
-                    'Cargo.toml': 'rust', 'Cargo.lock': 'rust',
-                    
-                    # PHP
-                    'composer.json': 'php', 'composer.lock': 'php',
-                    'laravel': 'laravel', 'symfony': 'symfony',
-                    
-                    # Ruby
-                    'Gemfile': 'ruby', 'Gemfile.lock': 'ruby', 'Rakefile': 'ruby',
-                    'rails': 'rails', 'sinatra': 'sinatra',
-                    
-                    # Web frameworks
-                    'next.js': 'nextjs', 'nuxt.js': 'nuxt', 'gatsby': 'gatsby',
-                    'svelte': 'svelte', 'vue': 'vue', 'react': 'react',
-                    'angular': 'angular', 'ember': 'ember',
-                    
-                    # Mobile frameworks
-                    'react-native': 'react-native', 'flutter': 'flutter',
-                    'ionic': 'ionic', 'cordova': 'cordova',
-                    
-                    # Build tools
-                    'Makefile': 'make', 'CMakeLists.txt': 'cmake',
-                    'Dockerfile': 'docker', 'docker-compose.yml': 'docker',
-                    'Jenkinsfile': 'jenkins', '.github/workflows': 'github-actions',
-                    
-                    # Configuration
-                    'webpack': 'webpack', 'babel': 'babel', 'eslint': 'eslint',
-                    'prettier': 'prettier', 'typescript': 'typescript',
-                    'tailwind': 'tailwind', 'bootstrap': 'bootstrap',
-                    
-                    # Database
-                    'prisma': 'prisma', 'sequelize': 'sequelize', 'mongoose': 'mongoose',
-                    'typeorm': 'typeorm', 'sqlalchemy': 'sqlalchemy',
-                    
-                    # Testing
-                    'jest': 'jest', 'mocha': 'mocha', 'cypress': 'cypress',
-                    'pytest': 'pytest', 'unittest': 'unittest',
-                    
-                    # Documentation
-                    'docusaurus': 'docusaurus', 'gitbook': 'gitbook',
-                    'mkdocs': 'mkdocs', 'sphinx': 'sphinx'
-                }
-                
-                # Check for framework-specific files
-                for config_file, language in config_files.items():
-                    if file_path.name == config_file or config_file in file_path.name:
-                        if language not in languages:
-                            languages.append(language)
+        if project_scan is None:
+            project_scan = _scan_project(project_path)
+        languages = list(project_scan.languages)
         
         # Filter out documentation and configuration languages for main detection
         documentation_langs = {'markdown', 'text', 'log', 'json', 'yaml', 'xml', 'ini', 'config', 'sqlite', 'database'}
@@ -1495,15 +2070,15 @@ class ProjectManagerGUI:
     
     def _detect_js_frameworks(self, project_path: Path) -> list:
         """Detect JavaScript frameworks by analyzing package.json and other config files"""
-        frameworks = []
+        # Insertion-ordered set: dict keys keep the detection order the callers rely on
+        frameworks = {}
+        names = _dir_names(project_path)
         
         # Check package.json for framework dependencies
         package_json_path = project_path / 'package.json'
-        if package_json_path.exists():
+        if 'package.json' in names:
             try:
-                import json
-                with open(package_json_path, 'r', encoding='utf-8') as f:
-                    package_data = json.load(f)
+                package_data = _read_manifest(package_json_path)
                 
                 # Check dependencies and devDependencies
                 all_deps = {}
@@ -1511,185 +2086,53 @@ class ProjectManagerGUI:
                 all_deps.update(package_data.get('devDependencies', {}))
                 all_deps.update(package_data.get('peerDependencies', {}))
                 
-                # Framework detection based on dependencies
-                framework_deps = {
-                    # React ecosystem
-                    'react': 'react', 'react-dom': 'react', 'next': 'nextjs',
-                    'gatsby': 'gatsby', 'remix': 'remix',
-                    
-                    # Vue ecosystem
-                    'vue': 'vue', 'nuxt': 'nuxt', 'vue-router': 'vue',
-                    'vuex': 'vue', 'pinia': 'vue',
-                    
-                    # Angular ecosystem
-                    '@angular/core': 'angular', '@angular/common': 'angular',
-                    '@angular/platform-browser': 'angular',
-                    
-                    # Svelte ecosystem
-                    'svelte': 'svelte', 'sveltekit': 'svelte',
-                    
-                    # Astro
-                    'astro': 'astro',
-                    
-                    # Build tools
-                    'vite': 'vite', 'webpack': 'webpack', 'rollup': 'rollup',
-                    'parcel': 'parcel', 'esbuild': 'esbuild',
-                    
-                    # CSS frameworks
-                    'tailwindcss': 'tailwind', 'bootstrap': 'bootstrap',
-                    'bulma': 'bulma', 'materialize-css': 'materialize',
-                    'antd': 'antd', 'chakra-ui': 'chakra', 'mantine': 'mantine',
-                    
-                    # Testing frameworks
-                    'jest': 'jest', 'vitest': 'vitest', 'cypress': 'cypress',
-                    'playwright': 'playwright', 'puppeteer': 'puppeteer',
-                    'testing-library': 'testing-library',
-                    
-                    # State management
-                    'redux': 'redux', 'mobx': 'mobx', 'zustand': 'zustand',
-                    'jotai': 'jotai', 'recoil': 'recoil',
-                    
-                    # UI libraries
-                    'material-ui': 'mui', '@mui/material': 'mui',
-                    'ant-design': 'antd', 'semantic-ui-react': 'semantic',
-                    'react-bootstrap': 'react-bootstrap',
-                    
-                    # Backend frameworks
-                    'express': 'express', 'fastify': 'fastify', 'koa': 'koa',
-                    'nest': 'nestjs', 'adonisjs': 'adonisjs',
-                    
-                    # Database ORMs
-                    'prisma': 'prisma', 'sequelize': 'sequelize', 'mongoose': 'mongoose',
-                    'typeorm': 'typeorm', 'drizzle': 'drizzle',
-                    
-                    # Full-stack frameworks
-                    't3': 't3', 'blitz': 'blitz', 'redwood': 'redwood',
-                    'sails': 'sails', 'strapi': 'strapi', 'keystone': 'keystone'
-                }
-                
                 # Check for framework dependencies
-                for dep, framework in framework_deps.items():
+                for dep, framework in _FRAMEWORK_DEPS.items():
                     if dep in all_deps:
-                        if framework not in frameworks:
-                            frameworks.append(framework)
+                        frameworks[framework] = None
                 
                 # Check for specific framework patterns in package.json
                 scripts = package_data.get('scripts', {})
                 for script_name, script_content in scripts.items():
                     if isinstance(script_content, str):
                         if 'next' in script_content and 'nextjs' not in frameworks:
-                            frameworks.append('nextjs')
+                            frameworks['nextjs'] = None
                         elif 'nuxt' in script_content and 'nuxt' not in frameworks:
-                            frameworks.append('nuxt')
+                            frameworks['nuxt'] = None
                         elif 'gatsby' in script_content and 'gatsby' not in frameworks:
-                            frameworks.append('gatsby')
+                            frameworks['gatsby'] = None
                         elif 'remix' in script_content and 'remix' not in frameworks:
-                            frameworks.append('remix')
+                            frameworks['remix'] = None
                         elif 'astro' in script_content and 'astro' not in frameworks:
-                            frameworks.append('astro')
+                            frameworks['astro'] = None
                         elif 'svelte' in script_content and 'svelte' not in frameworks:
-                            frameworks.append('svelte')
+                            frameworks['svelte'] = None
                 
             except Exception as e:
                 print(f"Error reading package.json: {e}")
         
         # Check for framework-specific config files
-        framework_configs = {
-            'next.config.js': 'nextjs', 'next.config.ts': 'nextjs',
-            'nuxt.config.js': 'nuxt', 'nuxt.config.ts': 'nuxt',
-            'vue.config.js': 'vue', 'vue.config.ts': 'vue',
-            'angular.json': 'angular', 'angular-cli.json': 'angular',
-            'svelte.config.js': 'svelte', 'svelte.config.ts': 'svelte',
-            'remix.config.js': 'remix', 'remix.config.ts': 'remix',
-            'astro.config.js': 'astro', 'astro.config.ts': 'astro',
-            'gatsby-config.js': 'gatsby', 'gatsby-config.ts': 'gatsby',
-            'tailwind.config.js': 'tailwind', 'tailwind.config.ts': 'tailwind',
-            'vite.config.js': 'vite', 'vite.config.ts': 'vite',
-            'webpack.config.js': 'webpack', 'webpack.config.ts': 'webpack',
-            'rollup.config.js': 'rollup', 'rollup.config.ts': 'rollup',
-            'jest.config.js': 'jest', 'jest.config.ts': 'jest',
-            'cypress.config.js': 'cypress', 'cypress.config.ts': 'cypress',
-            'playwright.config.js': 'playwright', 'playwright.config.ts': 'playwright',
-            'vitest.config.js': 'vitest', 'vitest.config.ts': 'vitest'
-        }
-        
-        for config_file, framework in framework_configs.items():
-            if (project_path / config_file).exists():
-                if framework not in frameworks:
-                    frameworks.append(framework)
+        for config_file, framework in _FRAMEWORK_CONFIGS.items():
+            if config_file in names:
+                frameworks[framework] = None
         
-        return frameworks
+        return list(frameworks)
     
     def _determine_primary_language(self, languages: list, project_path: Path) -> str:
         """Determine the primary language in a multi-language project"""
-        # Language priority based on common project patterns
-        language_priority = {
-            # Web development
-            'javascript': 10, 'typescript': 10, 'html': 8, 'css': 7,
-            'vue': 9, 'react': 9, 'angular': 9, 'svelte': 9,
-            'nextjs': 9, 'nuxt': 9, 'gatsby': 9,
-            
-            # Backend languages
-            'python': 8, 'java': 8, 'csharp': 8, 'go': 8, 'rust': 8,
-            'php': 7, 'ruby': 7, 'nodejs': 7,
-            
-            # Mobile development
-            'swift': 8, 'dart': 8, 'kotlin': 8, 'react-native': 8,
-            
-            # System languages
-            'c': 6, 'cpp': 6, 'assembly': 5,
-            
-            # Scripting
-            'bash': 5, 'powershell': 5, 'lua': 4, 'perl': 4,
-            
-            # Data and documentation
-            'sql': 4, 'markdown': 3, 'json': 3, 'yaml': 3
-        }
-        
-        # Check for framework indicators that might indicate primary language
-        framework_indicators = {
-            'package.json': 'javascript',
-            'requirements.txt': 'python',
-            'Cargo.toml': 'rust',
-            'go.mod': 'go',
-            'pom.xml': 'java',
-            'composer.json': 'php',
-            'Gemfile': 'ruby'
-        }
-        
         # Check for framework files first
-        for file_name, lang in framework_indicators.items():
-            if (project_path / file_name).exists() and lang in languages:
+        names = _dir_names(project_path)
+        for file_name, lang in _FRAMEWORK_INDICATORS.items():
+            if file_name in names and lang in languages:
                 return lang
         
-        # If no framework file, use priority system
-        scored_languages = []
-        for lang in languages:
-            score = language_priority.get(lang, 1)
-            scored_languages.append((score, lang))
-        
-        # Return highest priority language
-        scored_languages.sort(reverse=True)
-        return scored_languages[0][1] if scored_languages else languages[0]
+        # If no framework file, return the highest priority language (ties go to the later name)
+        return max(languages, key=lambda lang: (_LANG_PRIORITY.get(lang, 1), lang))
     
-    def detect_project_type(self, project_path: Path) -> tuple:
+    def detect_project_type(self, project_path: Path, project_scan: Optional[ProjectScan] = None) -> tuple:
         """Detect project type, language, and framework with multi-language support"""
-        files_to_check = {
-            'package.json': ('nodejs', 'javascript', 'node'),
-            'requirements.txt': ('python', 'python', 'flask'),
-            'Cargo.toml': ('rust', 'rust', 'cargo'),
-            'go.mod': ('go', 'go', 'go'),
-            'pom.xml': ('java', 'java', 'maven'),
-            'composer.json': ('php', 'php', 'composer'),
-            'Gemfile': ('ruby', 'ruby', 'bundler'),
-            'Dockerfile': ('docker', 'docker', 'docker'),
-            'docker-compose.yml': ('docker', 'docker', 'docker-compose'),
-            'Makefile': ('c', 'c', 'make'),
-            'CMakeLists.txt': ('cpp', 'cpp', 'cmake')
-        }
-        
         # Detect all languages in the project
-        languages = self._detect_languages(project_path)
+        languages = self._detect_languages(project_path, project_scan)
         
         # If multiple languages detected, return specific languages
         if len(languages) > 1:
@@ -1698,10 +2141,11 @@ class ProjectManagerGUI:
             return ('multi-language', f"{', '.join(languages)}", f"mixed ({primary_lang})")
         
         # Check for bash scripting projects
-        bash_files = list(project_path.glob('*.sh'))
+        names = _dir_names(project_path)
+        bash_files = [name for name in names if name.endswith('.sh')]
         if bash_files:
             # Check if it's a shell script collection or automation project
-            if len(bash_files) > 1 or any('install' in f.name.lower() or 'setup' in f.name.lower() or 'deploy' in f.name.lower() for f in bash_files):
+            if len(bash_files) > 1 or any('install' in f.lower() or 'setup' in f.lower() or 'deploy' in f.lower() for f in bash_files):
                 return ('bash-automation', 'bash', 'shell')
             else:
                 return ('bash-script', 'bash', 'shell')
@@ -1709,51 +2153,60 @@ class ProjectManagerGUI:
         # Check for shell script directories
         shell_dirs = ['scripts', 'bin', 'tools', 'automation']
         for shell_dir in shell_dirs:
-            if (project_path / shell_dir).exists():
+            if shell_dir in names:
                 shell_files = list((project_path / shell_dir).glob('*.sh'))
                 if shell_files:
                     return ('bash-automation', 'bash', 'shell')
         
-        for file_name, (project_type, language, framework) in files_to_check.items():
-            if (project_path / file_name).exists():
+        for file_name, (project_type, language, framework) in _PROJECT_TYPE_FILES.items():
+            if file_name in names:
                 return project_type, language, framework
         
-        if (project_path / 'src').exists():
+        if 'src' in names:
             return 'generic', 'unknown', 'unknown'
         
         return 'unknown', 'unknown', 'unknown'
     
-    def get_directory_size(self, path: Path) -> str:
+    def get_directory_size(self, path: Path, limit: Optional[int] = SIZE_SCAN_FILE_LIMIT) -> str:
         """Get human-readable directory size"""
-        total_size = 0
-        for file_path in path.rglob('*'):
-            if file_path.is_file():
-                total_size += file_path.stat().st_size
-        
+        return self._format_tree_stats_size(_scan_tree(path, limit=limit))
+    
+    def _format_tree_stats_size(self, tree_stats: TreeStats) -> str:
+        """Format a scanned size, marking totals cut short by the file limit as a lower bound"""
+        size = self._format_tree_size(tree_stats.size)
+        return f"≥ {size}" if tree_stats.approximate else size
+    
+    def _format_tree_size(self, total_size: float) -> str:
+        """Format a byte count the way the projects table shows sizes"""
         for unit in ['B', 'KB', 'MB', 'GB']:
             if total_size < 1024.0:
                 return f"{total_size:.1f} {unit}"
             total_size /= 1024.0
         return f"{total_size:.1f} TB"
     
-    def calculate_health_score(self, project_path: Path, language: str) -> int:
+    def calculate_health_score(self, project_path: Path, language: str, project_scan: Optional[ProjectScan] = None) -> int:
         """Calculate comprehensive project health score (0-100) with multi-language support"""
         score = 100
+        if project_scan is None:
+            project_scan = _scan_project(project_path, time.time_ns() - _RECENT_WINDOW_NS)
         
         # Detect if this is a multi-language project
-        languages = self._detect_languages(project_path)
+        languages = self._detect_languages(project_path, project_scan)
         is_multi_language = len(languages) > 1
         
+        # Top-level checks below test this one listing instead of stat'ing each candidate
+        names = _dir_names(project_path)
+        
         # === ESSENTIAL DOCUMENTATION ===
-        if not (project_path / 'README.md').exists():
+        if 'README.md' not in names:
             score -= 10
-        if not (project_path / '.gitignore').exists():
+        if '.gitignore' not in names:
             score -= 5
         
         # === TESTING INFRASTRUCTURE ===
         test_dirs = ['tests', 'test', '__tests__', 'spec', 'test_', 'tests_']
         test_files = ['test_*.py', '*_test.py', '*.test.js', '*.spec.js', '*.test.ts']
-        has_tests = any((project_path / test_dir).exists() for test_dir in test_dirs)
+        has_tests = not names.isdisjoint(test_dirs)
         has_test_files = any(project_path.glob(pattern) for pattern in test_files)
         if not has_tests and not has_test_files:
             score -= 15
@@ -1761,38 +2214,40 @@ class ProjectManagerGUI:
         # === DOCUMENTATION ===
         doc_dirs = ['docs', 'documentation', 'doc', 'wiki']
         doc_files = ['CHANGELOG.md', 'CONTRIBUTING.md', 'LICENSE', 'LICENSE.txt', 'LICENSE.md']
-        has_docs = any((project_path / doc_dir).exists() for doc_dir in doc_dirs)
-        has_doc_files = any((project_path / doc_file).exists() for doc_file in doc_files)
+        has_docs = not names.isdisjoint(doc_dirs)
+        has_doc_files = not names.isdisjoint(doc_files)
         if not has_docs and not has_doc_files:
             score -= 5
         
         # === VERSION CONTROL ===
-        if not (project_path / '.git').exists():
+        if '.git' not in names:
             score -= 10  # No git repository
         else:
             # Check for git hooks
             git_hooks = project_path / '.git' / 'hooks'
-            if git_hooks.exists() and any(git_hooks.glob('*')):
+            if os.path.isdir(git_hooks) and any(git_hooks.glob('*')):
                 score += 2  # Bonus for git hooks
         
         # === SECURITY CHECKS ===
         security_files = ['.env.example', 'security.md', 'SECURITY.md']
-        has_security = any((project_path / sec_file).exists() for sec_file in security_files)
+        has_security = not names.isdisjoint(security_files)
         if not has_security:
             score -= 3
         
         # Check for hardcoded secrets (basic check)
-        secret_patterns = ['password', 'secret', 'key', 'token', 'api_key']
         has_secrets = False
-        for file_path in project_path.rglob('*.py'):
-            if file_path.is_file():
+        # Nothing is pruned here, matching the rglob this replaced
+        for entry in _iter_files(project_path, prune=frozenset()):
+            if entry.name.endswith('.py'):
                 try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read().lower()
-                        if any(pattern in content for pattern in secret_patterns):
-                            has_secrets = True
-                            break
-                except:
+                    with open(entry.path, 'rb') as f:
+                        if os.fstat(f.fileno()).st_size == 0:
+                            continue  # empty files can't be mapped
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            if _SECRET_RE.search(mm):
+                                has_secrets = True
+                                break
+                except (OSError, ValueError):
                     pass
         if has_secrets:
             score -= 5  # Potential security issue
@@ -1851,7 +2306,7 @@ class ProjectManagerGUI:
             missing_deps = 0
             for lang in languages:
                 if lang in dep_files:
-                    has_dep_file = any((project_path / dep_file).exists() for dep_file in dep_files[lang])
+                    has_dep_file = not names.isdisjoint(dep_files[lang])
                     if not has_dep_file:
                         missing_deps += 1
             if missing_deps > 0:
@@ -1859,66 +2314,54 @@ class ProjectManagerGUI:
         else:
             # Single language dependency check
             if language in dep_files:
-                has_dep_file = any((project_path / dep_file).exists() for dep_file in dep_files[language])
+                has_dep_file = not names.isdisjoint(dep_files[language])
                 if not has_dep_file:
                     score -= 8
         
         # === CONFIGURATION FILES ===
         config_files = ['.editorconfig', '.gitattributes', 'docker-compose.yml', 'Dockerfile']
-        has_config = any((project_path / config_file).exists() for config_file in config_files)
+        has_config = not names.isdisjoint(config_files)
         if has_config:
             score += 3  # Bonus for good configuration
         
         # === CODE QUALITY INDICATORS ===
         # Check for linting configuration
         lint_files = ['.eslintrc', '.eslintrc.js', '.eslintrc.json', '.pylintrc', 'pyproject.toml']
-        has_linting = any((project_path / lint_file).exists() for lint_file in lint_files)
+        has_linting = not names.isdisjoint(lint_files)
         if has_linting:
             score += 2
         
         # Check for CI/CD
         ci_dirs = ['.github', '.gitlab-ci', '.circleci', '.travis', '.jenkins']
-        has_ci = any((project_path / ci_dir).exists() for ci_dir in ci_dirs)
+        has_ci = not names.isdisjoint(ci_dirs)
         if has_ci:
             score += 5  # Bonus for CI/CD
         
         # === PROJECT STRUCTURE ===
         # Check for proper source organization
         src_dirs = ['src', 'lib', 'app', 'source']
-        has_src = any((project_path / src_dir).exists() for src_dir in src_dirs)
+        has_src = not names.isdisjoint(src_dirs)
         if has_src:
             score += 2
         
         # Check for build/compilation files
         build_files = ['Makefile', 'CMakeLists.txt', 'build.sh', 'compile.sh']
-        has_build = any((project_path / build_file).exists() for build_file in build_files)
+        has_build = not names.isdisjoint(build_files)
         if has_build:
             score += 2
         
         # === MAINTENANCE INDICATORS ===
         # Check for recent activity (files modified in last 30 days)
-        recent_files = 0
-        try:
-            for file_path in project_path.rglob('*'):
-                if file_path.is_file() and not file_path.name.startswith('.'):
-                    if (datetime.datetime.now() - datetime.datetime.fromtimestamp(file_path.stat().st_mtime)).days < 30:
-                        recent_files += 1
-                        if recent_files >= 3:  # At least 3 recent files
-                            score += 2
-                            break
-        except:
-            pass
+        if project_scan.recent_files >= 3:  # At least 3 recent files
+            score += 2
         
         # === SIZE AND COMPLEXITY ===
         # Check for reasonable project size (not too small, not too large)
-        try:
-            total_files = len(list(project_path.rglob('*')))
-            if total_files < 3:
-                score -= 5  # Too small, might be incomplete
-            elif total_files > 1000:
-                score -= 2  # Very large, might need organization
-        except:
-            pass
+        total_files = project_scan.stats.file_count
+        if total_files < 3:
+            score -= 5  # Too small, might be incomplete
+        elif total_files > 1000:
+            score -= 2  # Very large, might need organization
         
         return max(0, min(100, score))  # Ensure score is between 0-100
     
@@ -1927,13 +2370,14 @@ class ProjectManagerGUI:
         score = 0
         
         # Check for virtual environment
+        names = _dir_names(project_path)
         venv_dirs = ['venv', 'env', '.venv', '.env']
-        if any((project_path / venv_dir).exists() for venv_dir in venv_dirs):
+        if not names.isdisjoint(venv_dirs):
             score += 2
         
         # Check for requirements.txt with pinned versions
         req_file = project_path / 'requirements.txt'
-        if req_file.exists():
+        if 'requirements.txt' in names:
             try:
                 with open(req_file, 'r') as f:
                     content = f.read()
@@ -1943,8 +2387,7 @@ class ProjectManagerGUI:
                 pass
         
         # Check for __init__.py files (proper Python package structure)
-        init_files = list(project_path.rglob('__init__.py'))
-        if len(init_files) > 0:
+        if any(entry.name == '__init__.py' for entry in _iter_files(project_path, prune=frozenset())):
             score += 1
         
         return score
@@ -1952,23 +2395,22 @@ class ProjectManagerGUI:
     def _check_javascript_health(self, project_path: Path) -> int:
         """Check JavaScript-specific health indicators"""
         score = 0
+        names = _dir_names(project_path)
         
         # Check for package.json with proper scripts
         pkg_file = project_path / 'package.json'
-        if pkg_file.exists():
+        if 'package.json' in names:
             try:
-                with open(pkg_file, 'r') as f:
-                    import json
-                    pkg_data = json.load(f)
-                    if 'scripts' in pkg_data and len(pkg_data['scripts']) > 0:
-                        score += 2
-                    if 'devDependencies' in pkg_data:
-                        score += 1
+                pkg_data = _read_manifest(pkg_file)
+                if 'scripts' in pkg_data and len(pkg_data['scripts']) > 0:
+                    score += 2
+                if 'devDependencies' in pkg_data:
+                    score += 1
             except:
                 pass
         
         # Check for node_modules (dependencies installed)
-        if (project_path / 'node_modules').exists():
+        if 'node_modules' in names:
             score += 1
         
         return score
@@ -1976,10 +2418,11 @@ class ProjectManagerGUI:
     def _check_rust_health(self, project_path: Path) -> int:
         """Check Rust-specific health indicators"""
         score = 0
+        names = _dir_names(project_path)
         
         # Check for Cargo.toml with proper metadata
         cargo_file = project_path / 'Cargo.toml'
-        if cargo_file.exists():
+        if 'Cargo.toml' in names:
             try:
                 with open(cargo_file, 'r') as f:
                     content = f.read()
@@ -1991,7 +2434,7 @@ class ProjectManagerGUI:
                 pass
         
         # Check for Cargo.lock (dependencies locked)
-        if (project_path / 'Cargo.lock').exists():
+        if 'Cargo.lock' in names:
             score += 1
         
         return score
@@ -1999,10 +2442,11 @@ class ProjectManagerGUI:
     def _check_go_health(self, project_path: Path) -> int:
         """Check Go-specific health indicators"""
         score = 0
+        names = _dir_names(project_path)
         
         # Check for go.mod with proper module declaration
         go_mod = project_path / 'go.mod'
-        if go_mod.exists():
+        if 'go.mod' in names:
             try:
                 with open(go_mod, 'r') as f:
                     content = f.read()
@@ -2012,7 +2456,7 @@ class ProjectManagerGUI:
                 pass
         
         # Check for go.sum (dependencies locked)
-        if (project_path / 'go.sum').exists():
+        if 'go.sum' in names:
             score += 1
         
         return score
@@ -2022,12 +2466,11 @@ class ProjectManagerGUI:
         score = 0
         
         # Check for Maven or Gradle
-        if (project_path / 'pom.xml').exists() or (project_path / 'build.gradle').exists():
+        if not _dir_names(project_path).isdisjoint(('pom.xml', 'build.gradle')):
             score += 2
         
         # Check for proper Java package structure
-        java_files = list(project_path.rglob('*.java'))
-        if len(java_files) > 0:
+        if any(entry.name.endswith('.java') for entry in _iter_files(project_path, prune=frozenset())):
             score += 1
         
         return score
@@ -2037,80 +2480,66 @@ class ProjectManagerGUI:
         score = 0
         
         # Check for shell script files
-        bash_files = list(project_path.glob('*.sh'))
+        bash_files = [project_path / name for name in _dir_names(project_path) if name.endswith('.sh')]
         if bash_files:
             score += 2  # Has shell scripts
         
-        # Check for proper shebang in scripts
+        # Read each script once and collect every content signal from it, stopping once all are found
         proper_shebang = False
+        error_handling = False
+        logging = False
+        documented_scripts = 0
         for bash_file in bash_files:
             try:
                 with open(bash_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    first_line = f.readline().strip()
-                    if first_line.startswith('#!/bin/bash') or first_line.startswith('#!/usr/bin/env bash'):
-                        proper_shebang = True
-                        break
+                    content = f.read()
             except:
-                pass
+                continue
+            
+            lines = content.split('\n')
+            if not proper_shebang:
+                first_line = lines[0].strip()
+                proper_shebang = first_line.startswith('#!/bin/bash') or first_line.startswith('#!/usr/bin/env bash')
+            if not error_handling:
+                error_handling = 'set -e' in content or 'set -o errexit' in content or 'trap' in content
+            if not logging:
+                logging = 'echo' in content and ('log' in content or 'Log' in content)
+            if not documented_scripts:
+                comment_lines = 0
+                total_lines = 0
+                for line in lines:
+                    line = line.strip()
+                    if line:
+                        total_lines += 1
+                        if line.startswith('#'):
+                            comment_lines += 1
+                if total_lines > 0 and comment_lines / total_lines > 0.1:  # At least 10% comments
+                    documented_scripts += 1
+            
+            if proper_shebang and error_handling and logging and documented_scripts:
+                break
         
         if proper_shebang:
             score += 2  # Proper shebang
         
-        # Check for error handling in scripts
-        error_handling = False
-        for bash_file in bash_files:
-            try:
-                with open(bash_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    if 'set -e' in content or 'set -o errexit' in content or 'trap' in content:
-                        error_handling = True
-                        break
-            except:
-                pass
-        
         if error_handling:
             score += 2  # Good error handling
         
-        # Check for logging in scripts
-        logging = False
-        for bash_file in bash_files:
-            try:
-                with open(bash_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    if 'echo' in content and ('log' in content or 'Log' in content):
-                        logging = True
-                        break
-            except:
-                pass
-        
         if logging:
             score += 1  # Has logging
         
         # Check for configuration files
         config_files = ['config.sh', 'settings.sh', '.env', 'config.json']
-        has_config = any((project_path / config_file).exists() for config_file in config_files)
+        has_config = not _dir_names(project_path).isdisjoint(config_files)
         if has_config:
             score += 1  # Has configuration
         
-        # Check for documentation in scripts (comments)
-        documented_scripts = 0
-        for bash_file in bash_files:
-            try:
-                with open(bash_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    comment_lines = len([line for line in content.split('\n') if line.strip().startswith('#')])
-                    total_lines = len([line for line in content.split('\n') if line.strip()])
-                    if total_lines > 0 and comment_lines / total_lines > 0.1:  # At least 10% comments
-                        documented_scripts += 1
-            except:
-                pass
-        
         if documented_scripts > 0:
             score += 1  # Well-documented scripts
         
         # Check for automation/CI integration
         automation_files = ['install.sh', 'setup.sh', 'deploy.sh', 'build.sh', 'test.sh']
-        has_automation = any((project_path / auto_file).exists() for auto_file in automation_files)
+        has_automation = not _dir_names(project_path).isdisjoint(automation_files)
         if has_automation:
             score += 2  # Has automation scripts
         
@@ -2128,7 +2557,7 @@ class ProjectManagerGUI:
         }
         
         if language in dep_files:
-            return any((project_path / dep_file).exists() for dep_file in dep_files[language])
+            return not _dir_names(project_path).isdisjoint(dep_files[language])
         return False
     
     def _get_health_recommendations(self, project_path: Path, health_score: int) -> str:
@@ -2138,32 +2567,34 @@ class ProjectManagerGUI:
         if health_score >= 90:
             return "🎉 Excellent! Your project is in great shape. Keep up the good work!"
         
-        if not (project_path / 'README.md').exists():
+        names = _dir_names(project_path)
+        
+        if 'README.md' not in names:
             recommendations.append("📝 Add a README.md file with project description and setup instructions")
         
-        if not (project_path / '.git').exists():
+        if '.git' not in names:
             recommendations.append("🔧 Initialize a Git repository: git init")
         
-        if not (project_path / '.gitignore').exists():
+        if '.gitignore' not in names:
             recommendations.append("🚫 Create a .gitignore file to exclude unnecessary files")
         
         test_dirs = ['tests', 'test', '__tests__', 'spec']
-        if not any((project_path / test_dir).exists() for test_dir in test_dirs):
+        if names.isdisjoint(test_dirs):
             recommendations.append("🧪 Add a test directory and write unit tests")
         
         doc_dirs = ['docs', 'documentation', 'doc']
-        if not any((project_path / doc_dir).exists() for doc_dir in doc_dirs):
+        if names.isdisjoint(doc_dirs):
             recommendations.append("📚 Create a docs/ directory for additional documentation")
         
-        if not any((project_path / sec_file).exists() for sec_file in ['.env.example', 'security.md', 'SECURITY.md']):
+        if names.isdisjoint(['.env.example', 'security.md', 'SECURITY.md']):
             recommendations.append("🔒 Add security documentation and .env.example file")
         
         ci_dirs = ['.github', '.gitlab-ci', '.circleci']
-        if not any((project_path / ci_dir).exists() for ci_dir in ci_dirs):
+        if names.isdisjoint(ci_dirs):
             recommendations.append("⚙️ Set up CI/CD pipeline for automated testing and deployment")
         
         config_files = ['.editorconfig', '.gitattributes']
-        if not any((project_path / config_file).exists() for config_file in config_files):
+        if names.isdisjoint(config_files):
             recommendations.append("⚙️ Add configuration files like .editorconfig and .gitattributes")
         
         if health_score < 50:
@@ -2171,11 +2602,9 @@ class ProjectManagerGUI:
         
         return "\n".join(f"• {rec}" for rec in recommendations) if recommendations else "✅ No specific recommendations at this time."
     
-    def get_project_status(self, project_path: Path) -> str:
-        """Get project status"""
-        stat = project_path.stat()
-        last_modified = datetime.datetime.fromtimestamp(stat.st_mtime)
-        days_since_modified = (datetime.datetime.now() - last_modified).days
+    def get_project_status(self, stat_result: os.stat_result) -> str:
+        """Get project status from the directory's stat result"""
+        days_since_modified = int((time.time() - stat_result.st_mtime) // 86400)
         
         if days_since_modified < 7:
             return "Active"
@@ -2188,121 +2617,172 @@ class ProjectManagerGUI:
     
     def refresh_projects(self):
         """Refresh projects list with smart hierarchical structure"""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Add projects to tree
         if not self.projects:
             # Insert a message when no projects are found
+            self.tree.delete(*self.tree.get_children())
+            self._tree_rows.clear()
+            self._tree_children.clear()
+            self._tree_placeholders.clear()
             self.tree.insert('', 'end', text="No projects found", 
                            values=("", "", "", "", "", ""))
-        else:
-            # Group projects by hierarchy
-            root_projects = [p for p in self.projects if p.get('parent') is None]
-            sub_projects = [p for p in self.projects if p.get('parent') is not None]
-            
-            print(f"Hierarchy: {len(root_projects)} root projects, {len(sub_projects)} sub-projects")
+            self._check_scrollbar_visibility()
+            return
+        
+        if not self._tree_rows:
+            # Nothing rendered from projects yet; drop the "No projects found" row
+            self.tree.delete(*self.tree.get_children())
+        
+        # Group projects by parent once instead of rescanning the list for every project
+        children_by_parent = {}
+        for project in self.projects:
+            children_by_parent.setdefault(project.get('parent'), []).append(project)
+        
+        # Work out the rows the tree should show, parents before their children
+        desired_rows = {}
+        desired_children = {}
+        placeholders_wanted = set()
+        
+        def collect(parent_iid, projects):
+            for project in projects:
+                iid = project['path']
+                desired_children.setdefault(parent_iid, []).append(iid)
+                desired_rows[iid] = (parent_iid, project['name'], self._project_tree_values(project))
+                sub_projects = children_by_parent.get(iid)
+                if sub_projects:
+                    collect(iid, sub_projects)
+                elif project.get('has_subprojects') and iid not in self.loaded_items:
+                    placeholders_wanted.add(iid)
+        
+        collect('', children_by_parent.get(None, []))
+        
+        # Delete rows that went away; Tk drops their descendants with them
+        for iid in [iid for iid in self._tree_rows if iid not in desired_rows]:
+            if iid in self._tree_rows:
+                self.tree.delete(iid)
+                self._forget_tree_row(iid)
+        
+        # Insert new rows, reparent moved ones and update only changed values
+        for parent_iid, wanted in desired_children.items():
+            previous = self._tree_children.get(parent_iid, [])
+            for iid in wanted:
+                row = desired_rows[iid]
+                current = self._tree_rows.get(iid)
+                if current is None:
+                    self.tree.insert(parent_iid, 'end', iid=iid, text=row[1], values=row[2])
+                elif current[0] != parent_iid:
+                    self.tree.move(iid, parent_iid, 'end')
+                    self.tree.item(iid, text=row[1], values=row[2])
+                elif current != row:
+                    self.tree.item(iid, text=row[1], values=row[2])
+                self._tree_rows[iid] = row
             
-            # Add root projects with their sub-projects
-            for root_project in root_projects:
-                self._add_project_to_tree(root_project, self.projects)
+            # Surviving rows keep their place and new ones land at the end; fix up only if that's wrong
+            wanted_set = set(wanted)
+            actual = [iid for iid in previous if iid in wanted_set]
+            kept = set(actual)
+            actual += [iid for iid in wanted if iid not in kept]
+            if actual != wanted:
+                for index, iid in enumerate(wanted):
+                    self.tree.move(iid, parent_iid, index)
+            self._tree_children[parent_iid] = wanted
+        
+        for parent_iid in [p for p in self._tree_children if p not in desired_children]:
+            del self._tree_children[parent_iid]
+        
+        # Placeholder children make Tk show an expander until sub-projects are scanned
+        for iid in [iid for iid in self._tree_placeholders if iid not in placeholders_wanted]:
+            self.tree.delete(self._tree_placeholders.pop(iid))
+        for iid in placeholders_wanted:
+            if iid not in self._tree_placeholders:
+                self._tree_placeholders[iid] = self.tree.insert(iid, 'end', text='…loading', tags=('dummy',))
+                self.tree.item(iid, open=False)
         
         # Check scrollbar visibility after loading projects
-        self.root.after(100, self._check_scrollbar_visibility)
+        self._check_scrollbar_visibility()
     
-    def _add_project_to_tree(self, project, all_projects, parent_item=''):
-        """Add a project to the tree with proper hierarchical structure"""
-        # Use project name without indentation (tree handles hierarchy)
-        display_name = project['name']
-        
-        # Debug info
-        parent_info = f" (parent: {parent_item})" if parent_item else " (root)"
-        print(f"  Adding to tree: {display_name}{parent_info}")
-        
-        # Add project to tree
-        health_color = "green" if project['health'] >= 80 else "yellow" if project['health'] >= 60 else "red"
-        item_id = self.tree.insert(parent_item, 'end', text=display_name, 
-                           values=(project['type'], project['language'], project['status'], 
-                                 f"{project['health']}%", project['size'], project['modified']))
-        
-        # Find and add sub-projects
-        project_path = project.get('path', '')
-        sub_projects = [p for p in all_projects if p.get('parent') == project_path]
-        
-        print(f"    Looking for sub-projects of {project_path}: found {len(sub_projects)}")
-        
-        # If there are sub-projects, add them as children (collapsed by default)
-        if sub_projects:
-            for sub_project in sub_projects:
-                print(f"    Adding sub-project: {sub_project['name']}")
-                self._add_project_to_tree(sub_project, all_projects, item_id)
-            # Keep parent collapsed initially to show hierarchy
-            self.tree.item(item_id, open=False)
-            print(f"    Set {display_name} to collapsed")
+    def _forget_tree_row(self, iid):
+        """Drop a deleted row and its descendants from the rendered-tree bookkeeping"""
+        self._tree_rows.pop(iid, None)
+        self._tree_placeholders.pop(iid, None)
+        for child in self._tree_children.pop(iid, ()):
+            self._forget_tree_row(child)
+    
+    def _project_tree_values(self, project) -> tuple:
+        """Format a project's row values for the tree"""
+        return (project['type'], project['language'], project['status'],
+                f"{project['health']}%", project['size'], project['modified'])
     
     def on_tree_expand(self, event):
         """Handle tree expansion with lazy loading"""
         item = self.tree.focus()
-        if not item:
+        if not item or item in self.loaded_items:
             return
         
         # Mark as loaded to prevent re-analysis
         self.loaded_items.add(item)
         
-        # If this is a collection folder, load its sub-projects lazily
-        if self.tree.item(item, 'values')[0] == 'Collection':  # Check if it's a collection
-            self.load_collection_subprojects(item)
+        if item not in self._tree_placeholders:
+            return
+        
+        project = next((p for p in self.projects if p.get('path') == item), None)
+        if project is None:
+            return
+        
+        # Tk variables may only be read on the main thread
+        queue_background = bool(getattr(self, 'background_processing_var', None) and self.background_processing_var.get())
+        
+        self.status_var.set(f"Scanning {project['name']} for sub-projects...")
+        threading.Thread(target=self._load_subprojects_worker,
+                         args=(item, project.get('depth', 0) + 1, queue_background), daemon=True).start()
+    
+    def _load_subprojects_worker(self, item: str, depth: int, queue_background: bool):
+        """Scan one project's sub-projects off the Tk main loop"""
+        project_path = Path(item)
+        scan = {
+            'projects_dir': Path(self.config["projects_dir"]),
+            'projects': [],
+            'hierarchical_projects': {},
+            'background_queue': [],
+            'queue_background': queue_background,
+            'cache_hits': 0,
+            'cache_misses': 0,
+            'error': None
+        }
+        try:
+            cache = self._load_cache()
+            self._load_hierarchical_projects(project_path, project_path, depth, cache, scan)
+            self._save_cache(cache)
+        except Exception as e:
+            scan['error'] = e
+        
+        self.root.after(0, self._populate_subprojects, item, scan)
+    
+    def _populate_subprojects(self, item: str, scan: Dict):
+        """Replace an expanded project's placeholder with its scanned sub-projects"""
+        if scan['error'] is not None:
+            print(f"Error loading sub-projects of {item}: {scan['error']}")
+            self.status_var.set(f"Error loading sub-projects: {scan['error']}")
+            self.refresh_projects()
+            return
+        
+        known_paths = {project.get('path') for project in self.projects}
+        new_projects = [project for project in scan['projects'] if project['path'] not in known_paths]
+        self.projects.extend(new_projects)
+        for parent_key, children in scan['hierarchical_projects'].items():
+            self.hierarchical_projects.setdefault(parent_key, []).extend(children)
+        
+        # item is in loaded_items now, so the refresh swaps its placeholder for the new rows
+        self.refresh_projects()
+        
+        self.status_var.set(f"Found {len(new_projects)} sub-projects in {Path(item).name}")
+        
+        self._queue_background_analysis(scan['background_queue'])
     
     def on_tree_collapse(self, event):
         """Handle tree collapse"""
         # No special handling needed for collapse
         pass
     
-    def load_collection_subprojects(self, parent_item):
-        """Load sub-projects for a collection folder lazily"""
-        try:
-            # Get the project path from the item
-            item_text = self.tree.item(parent_item, 'text')
-            project_path = None
-            
-            # Find the project in our projects list
-            for project in self.projects:
-                if project['name'] == item_text:
-                    project_path = Path(project['path'])
-                    break
-            
-            if not project_path or not project_path.exists():
-                return
-            
-            # Check if this is a collection folder
-            if not self._is_collection_folder(project_path):
-                return
-            
-            # Get existing children to avoid duplicates
-            existing_children = self.tree.get_children(parent_item)
-            if existing_children:
-                return  # Already loaded
-            
-            # Load sub-projects with quick analysis only
-            subdirs = [d for d in project_path.iterdir() if d.is_dir() and not d.name.startswith('.')]
-            
-            for subdir in subdirs[:10]:  # Limit to 10 for performance
-                if self._has_project_indicators(subdir):
-                    # Quick analysis only - no heavy computation
-                    project_info = self._quick_analyze_project(subdir)
-                    if project_info:
-                        # Add to tree with minimal data
-                        child_item = self.tree.insert(parent_item, 'end', 
-                                                   text=project_info['name'],
-                                                   values=('Quick', 'Loading...', 'Loading...', 'Loading...', 'Loading...', 'Loading...'))
-                        
-                        # Store the project info for later use
-                        self.tree.set(child_item, 'project_path', str(subdir))
-                        
-        except Exception as e:
-            print(f"Error loading collection subprojects: {e}")
-    
     def show_context_menu(self, event):
         """Show comprehensive right-click context menu"""
         # Get the item under the cursor
@@ -2314,18 +2794,38 @@ class ProjectManagerGUI:
         if item not in self.tree.selection():
             self.tree.selection_set(item)
         
-        # Create context menu
-        context_menu = tk.Menu(self.root, tearoff=0, bg=self.colors['bg_secondary'], 
-                              fg=self.colors['text_primary'], activebackground=self.colors['accent'],
-                              activeforeground=self.colors['text_primary'])
+        if self._context_menu is None:
+            self._context_menu = self._build_context_menu()
+        context_menu = self._context_menu
         
         # Get selected items
         selected_items = self.tree.selection()
         is_multiple = len(selected_items) > 1
         
+        # Only the bulk entry depends on the selection
+        if is_multiple and not self._bulk_ops_shown:
+            context_menu.insert_command(self._bulk_ops_index, label="📦 Bulk Operations", command=self.bulk_operations)
+            context_menu.insert_separator(self._bulk_ops_index + 1)
+        elif not is_multiple and self._bulk_ops_shown:
+            context_menu.delete(self._bulk_ops_index, self._bulk_ops_index + 1)
+        self._bulk_ops_shown = is_multiple
+        
+        # Show the context menu
+        try:
+            context_menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            context_menu.grab_release()
+    
+    def _build_context_menu(self) -> tk.Menu:
+        """Build the right-click menu and its cascades once"""
+        context_menu = tk.Menu(self.root, tearoff=0, bg=self.colors['bg_secondary'], 
+                              fg=self.colors['text_primary'], activebackground=self.colors['accent'],
+                              activeforeground=self.colors['text_primary'])
+        
         # === PROJECT MANAGEMENT ===
         context_menu.add_command(label="📁 Open in Explorer", command=self.open_in_explorer)
         context_menu.add_command(label="🔍 Analyze Project", command=self.analyze_selected_projects)
+        context_menu.add_command(label="📏 Compute Exact Size", command=self.compute_exact_size)
         context_menu.add_command(label="📊 Generate Report", command=self.generate_project_report)
         context_menu.add_separator()
         
@@ -2351,9 +2851,8 @@ class ProjectManagerGUI:
         context_menu.add_cascade(label="📚 Git Operations", menu=git_menu)
         
         # === PROJECT OPERATIONS ===
-        if is_multiple:
-            context_menu.add_command(label="📦 Bulk Operations", command=self.bulk_operations)
-            context_menu.add_separator()
+        # "Bulk Operations" and its separator go here only while several projects are selected
+        self._bulk_ops_index = context_menu.index('end') + 1
         
         context_menu.add_command(label="📋 Copy Project Info", command=self.copy_project_info)
         context_menu.add_command(label="📁 Duplicate Project", command=self.duplicate_project)
@@ -2405,11 +2904,7 @@ class ProjectManagerGUI:
         danger_menu.add_command(label="📦 Archive Project", command=self.archive_project)
         context_menu.add_cascade(label="⚠️ Danger Zone", menu=danger_menu)
         
-        # Show the context menu
-        try:
-            context_menu.tk_popup(event.x_root, event.y_root)
-        finally:
-            context_menu.grab_release()
+        return context_menu
     
     def toggle_project_expansion(self, event):
         """Toggle project expansion/collapse on double-click"""
@@ -2484,48 +2979,40 @@ class ProjectManagerGUI:
         for item in selected_items:
             project_path = self._get_project_path_from_item(item)
             if project_path and project_path.exists():
-                import subprocess
-                import platform
                 try:
-                    if platform.system() == "Windows":
-                        subprocess.run(["explorer", str(project_path)], check=True)
-                    elif platform.system() == "Darwin":  # macOS
-                        subprocess.run(["open", str(project_path)], check=True)
-                    else:  # Linux
-                        subprocess.run(["xdg-open", str(project_path)], check=True)
+                    # Launch and move on; the GUI has no reason to wait for the file manager
+                    subprocess.Popen(_FILE_MANAGER_CMD + [str(project_path)])
                 except Exception as e:
                     print(f"Error opening explorer: {e}")
     
     def analyze_selected_projects(self):
-        """Analyze selected projects"""
+        """Queue a forced full analysis of the selected projects on the analysis pool"""
         selected_items = self.tree.selection()
         if not selected_items:
             return
         
-        self.status_var.set("🔍 Analyzing selected projects...")
-        self.root.update()
+        project_paths = []
+        for item in selected_items:
+            project_path = self._get_project_path_from_item(item)
+            if project_path and project_path.exists():
+                project_paths.append(project_path)
+        
+        # Results come back through _apply_bg_results, which updates the projects, the cache and the tree
+        self._queue_background_jobs(_analyze_project_worker, project_paths)
+    
+    def compute_exact_size(self):
+        """Queue a full size scan, ignoring the file limit, for the selected projects"""
+        selected_items = self.tree.selection()
+        if not selected_items:
+            return
         
+        project_paths = []
         for item in selected_items:
             project_path = self._get_project_path_from_item(item)
             if project_path and project_path.exists():
-                try:
-                    # Force full analysis
-                    project_info = self.analyze_project(project_path)
-                    if project_info:
-                        # Update tree item with new data
-                        self.tree.item(item, values=(
-                            project_info.get('type', 'Unknown'),
-                            project_info.get('language', 'Unknown'),
-                            project_info.get('status', 'Unknown'),
-                            f"{project_info.get('health', 0)}%",
-                            project_info.get('size', 'Unknown'),
-                            project_info.get('modified', 'Unknown')
-                        ))
-                except Exception as e:
-                    print(f"Error analyzing project: {e}")
+                project_paths.append(project_path)
         
-        self.status_var.set("✅ Analysis complete")
-        self.refresh_projects()
+        self._queue_background_jobs(_exact_size_worker, project_paths)
     
     def generate_project_report(self):
         """Generate comprehensive project report"""
@@ -2572,14 +3059,12 @@ class ProjectManagerGUI:
             project_path = self._get_project_path_from_item(item)
             if project_path and project_path.exists():
                 try:
-                    import subprocess
-                    import platform
-                    if platform.system() == "Windows":
-                        subprocess.run(["cmd", "/c", "start", "cmd", "/k", f"cd /d {project_path}"], check=True)
-                    elif platform.system() == "Darwin":  # macOS
-                        subprocess.run(["open", "-a", "Terminal", str(project_path)], check=True)
+                    if sys.platform == 'win32':
+                        subprocess.Popen(["cmd", "/c", "start", "cmd", "/k", f"cd /d {project_path}"])
+                    elif sys.platform == 'darwin':  # macOS
+                        subprocess.Popen(["open", "-a", "Terminal", str(project_path)])
                     else:  # Linux
-                        subprocess.run(["gnome-terminal", "--working-directory", str(project_path)], check=True)
+                        subprocess.Popen(["gnome-terminal", "--working-directory", str(project_path)])
                 except Exception as e:
                     print(f"Error opening terminal: {e}")
     
@@ -2630,24 +3115,30 @@ class ProjectManagerGUI:
                     print(f"Error opening in browser: {e}")
     
     def _get_project_path_from_item(self, item):
-        """Get project path from tree item"""
-        try:
-            # Check if it's a lazy-loaded item
-            project_path = self.tree.set(item, 'project_path')
-            if project_path and project_path != '':
-                return Path(project_path)
-            
-            # Otherwise, find in projects list
-            item_text = self.tree.item(item, 'text')
-            for project in self.projects:
-                if project['name'] == item_text:
-                    return Path(project['path'])
-        except Exception as e:
-            print(f"Error getting project path: {e}")
+        """Get project path from tree item; project rows use their path as the iid"""
+        if item in self._tree_rows:
+            return Path(item)
         return None
     
+    def _schedule_refresh(self):
+        """Refresh the tree at most once per 200ms while scan and analysis results stream in"""
+        if self._refresh_pending is None:
+            self._refresh_pending = self.root.after(200, self._do_refresh)
+    
+    def _do_refresh(self):
+        """Run the tree refresh queued by _schedule_refresh"""
+        self._refresh_pending = None
+        self.refresh_projects()
+    
     def _check_scrollbar_visibility(self, event=None):
+        """Schedule a scrollbar check, coalescing bursts of clicks, keys and resizes"""
+        if self._sb_check_pending is not None:
+            self.root.after_cancel(self._sb_check_pending)
+        self._sb_check_pending = self.root.after(50, self._do_check_scrollbar_visibility)
+    
+    def _do_check_scrollbar_visibility(self):
         """Check if horizontal scrollbar should be visible and position it correctly"""
+        self._sb_check_pending = None
         try:
             # Get the tree's content width
             self.tree.update_idletasks()
@@ -2705,7 +3196,7 @@ class ProjectManagerGUI:
             return
         
         self.status_var.set("🔄 Pulling latest changes...")
-        self.root.update()
+        self.root.update_idletasks()
         
         for item in selected_items:
             project_path = self._get_project_path_from_item(item)
@@ -2730,7 +3221,7 @@ class ProjectManagerGUI:
             return
         
         self.status_var.set("📤 Pushing changes...")
-        self.root.update()
+        self.root.update_idletasks()
         
         for item in selected_items:
             project_path = self._get_project_path_from_item(item)
@@ -2862,7 +3353,7 @@ class ProjectManagerGUI:
     def _bulk_update_dependencies(self, selected_items):
         """Bulk update dependencies for selected projects"""
         self.status_var.set("🔄 Updating dependencies...")
-        self.root.update()
+        self.root.update_idletasks()
         
         for item in selected_items:
             project_path = self._get_project_path_from_item(item)
@@ -2881,7 +3372,7 @@ class ProjectManagerGUI:
     def _bulk_clean_projects(self, selected_items):
         """Bulk clean selected projects"""
         self.status_var.set("🧹 Cleaning projects...")
-        self.root.update()
+        self.root.update_idletasks()
         
         for item in selected_items:
             project_path = self._get_project_path_from_item(item)
@@ -2903,7 +3394,7 @@ class ProjectManagerGUI:
     def _bulk_run_tests(self, selected_items):
         """Bulk run tests for selected projects"""
         self.status_var.set("🧪 Running tests...")
-        self.root.update()
+        self.root.update_idletasks()
         
         for item in selected_items:
             project_path = self._get_project_path_from_item(item)
@@ -2933,7 +3424,7 @@ class ProjectManagerGUI:
     def _bulk_generate_reports(self, selected_items):
         """Bulk generate reports for selected projects"""
         self.status_var.set("📊 Generating reports...")
-        self.root.update()
+        self.root.update_idletasks()
         
         report_data = []
         for item in selected_items:
@@ -2954,10 +3445,10 @@ class ProjectManagerGUI:
     def _bulk_export_projects(self, selected_items):
         """Bulk export selected projects"""
         self.status_var.set("📤 Exporting projects...")
-        self.root.update()
+        self.root.update_idletasks()
         
         # Create export directory
-        export_dir = Path.home() / "Desktop" / "ProjectExports"
+        export_dir = _HOME / "Desktop" / "ProjectExports"
         export_dir.mkdir(exist_ok=True)
         
         for item in selected_items:
@@ -3047,7 +3538,7 @@ class ProjectManagerGUI:
                     import os
                     
                     # Create archive
-                    archive_path = Path.home() / "Desktop" / f"{project_path.name}.zip"
+                    archive_path = _HOME / "Desktop" / f"{project_path.name}.zip"
                     shutil.make_archive(str(archive_path.with_suffix('')), 'zip', project_path)
                     
                     print(f"✅ Exported {project_path.name} to {archive_path}")
@@ -3064,7 +3555,7 @@ class ProjectManagerGUI:
             return
         
         self.status_var.set("🔍 Performing deep analysis...")
-        self.root.update()
+        self.root.update_idletasks()
         
         for item in selected_items:
             project_path = self._get_project_path_from_item(item)
@@ -3144,7 +3635,7 @@ class ProjectManagerGUI:
             return
         
         self.status_var.set("🔒 Performing security scan...")
-        self.root.update()
+        self.root.update_idletasks()
         
         for item in selected_items:
             project_path = self._get_project_path_from_item(item)
@@ -3192,7 +3683,7 @@ class ProjectManagerGUI:
             return
         
         self.status_var.set("📊 Performing performance check...")
-        self.root.update()
+        self.root.update_idletasks()
         
         for item in selected_items:
             project_path = self._get_project_path_from_item(item)
@@ -3217,7 +3708,7 @@ class ProjectManagerGUI:
             return
         
         self.status_var.set("🧪 Checking test coverage...")
-        self.root.update()
+        self.root.update_idletasks()
         
         for item in selected_items:
             project_path = self._get_project_path_from_item(item)
@@ -3241,7 +3732,7 @@ class ProjectManagerGUI:
             return
         
         self.status_var.set("📦 Checking dependencies...")
-        self.root.update()
+        self.root.update_idletasks()
         
         for item in selected_items:
             project_path = self._get_project_path_from_item(item)
@@ -3276,7 +3767,7 @@ class ProjectManagerGUI:
             return
         
         self.status_var.set("🔄 Auto-updating dependencies...")
-        self.root.update()
+        self.root.update_idletasks()
         
         for item in selected_items:
             project_path = self._get_project_path_from_item(item)
@@ -3304,7 +3795,7 @@ class ProjectManagerGUI:
             return
         
         self.status_var.set("🧹 Auto-cleaning projects...")
-        self.root.update()
+        self.root.update_idletasks()
         
         for item in selected_items:
             project_path = self._get_project_path_from_item(item)
@@ -3330,7 +3821,7 @@ class ProjectManagerGUI:
             return
         
         self.status_var.set("📝 Auto-generating documentation...")
-        self.root.update()
+        self.root.update_idletasks()
         
         for item in selected_items:
             project_path = self._get_project_path_from_item(item)
@@ -3386,7 +3877,7 @@ Add license information here.
             return
         
         self.status_var.set("🧪 Running tests...")
-        self.root.update()
+        self.root.update_idletasks()
         
         for item in selected_items:
             project_path = self._get_project_path_from_item(item)
@@ -3426,7 +3917,7 @@ Add license information here.
             return
         
         self.status_var.set("🏗️ Building projects...")
-        self.root.update()
+        self.root.update_idletasks()
         
         for item in selected_items:
             project_path = self._get_project_path_from_item(item)
@@ -3469,7 +3960,7 @@ Add license information here.
             return
         
         self.status_var.set("🔍 Analyzing code quality...")
-        self.root.update()
+        self.root.update_idletasks()
         
         for item in selected_items:
             project_path = self._get_project_path_from_item(item)
@@ -3522,7 +4013,7 @@ Add license information here.
             return
         
         self.status_var.set("📈 Performing performance profiling...")
-        self.root.update()
+        self.root.update_idletasks()
         
         for item in selected_items:
             project_path = self._get_project_path_from_item(item)
@@ -3548,7 +4039,7 @@ Add license information here.
             return
         
         self.status_var.set("🔒 Performing security audit...")
-        self.root.update()
+        self.root.update_idletasks()
         
         for item in selected_items:
             project_path = self._get_project_path_from_item(item)
@@ -3595,7 +4086,7 @@ Add license information here.
             return
         
         self.status_var.set("📊 Performing bundle analysis...")
-        self.root.update()
+        self.root.update_idletasks()
         
         for item in selected_items:
             project_path = self._get_project_path_from_item(item)
@@ -3638,7 +4129,7 @@ Add license information here.
             return
         
         self.status_var.set("🌐 Generating API documentation...")
-        self.root.update()
+        self.root.update_idletasks()
         
         for item in selected_items:
             project_path = self._get_project_path_from_item(item)
@@ -3776,7 +4267,7 @@ Add license information here.
             return
         
         # Create archive directory
-        archive_dir = Path.home() / "Desktop" / "ArchivedProjects"
+        archive_dir = _HOME / "Desktop" / "ArchivedProjects"
         archive_dir.mkdir(exist_ok=True)
         
         for item in selected_items:
@@ -3797,14 +4288,7 @@ Add license information here.
     
     def _get_directory_size(self, path):
         """Get directory size in bytes"""
-        try:
-            total_size = 0
-            for file_path in path.rglob("*"):
-                if file_path.is_file():
-                    total_size += file_path.stat().st_size
-            return total_size
-        except:
-            return 0
+        return _scan_tree(path, prune=frozenset()).size
     
     def _format_size(self, size_bytes):
         """Format size in human readable format"""
@@ -4179,28 +4663,29 @@ edition = "2021"
     def _check_cross_language_integration(self, project_path: Path, languages: list) -> bool:
         """Check for good cross-language integration in multi-language projects"""
         integration_score = 0
+        names = _dir_names(project_path)
         
         # Check for build scripts that handle multiple languages
         build_files = ['Makefile', 'build.sh', 'build.py', 'build.js', 'build.ps1']
-        has_build_script = any((project_path / build_file).exists() for build_file in build_files)
+        has_build_script = not names.isdisjoint(build_files)
         if has_build_script:
             integration_score += 1
         
         # Check for Docker/containerization (good for multi-language)
         docker_files = ['Dockerfile', 'docker-compose.yml', '.dockerignore']
-        has_docker = any((project_path / docker_file).exists() for docker_file in docker_files)
+        has_docker = not names.isdisjoint(docker_files)
         if has_docker:
             integration_score += 1
         
         # Check for CI/CD configuration
-        ci_files = ['.github/workflows', '.gitlab-ci.yml', 'azure-pipelines.yml', 'Jenkinsfile']
-        has_ci = any((project_path / ci_file).exists() for ci_file in ci_files)
+        ci_files = ['.gitlab-ci.yml', 'azure-pipelines.yml', 'Jenkinsfile']
+        has_ci = not names.isdisjoint(ci_files) or os.path.exists(project_path / '.github' / 'workflows')
         if has_ci:
             integration_score += 1
         
         # Check for documentation explaining multi-language setup
         readme_content = ""
-        if (project_path / 'README.md').exists():
+        if 'README.md' in names:
             try:
                 with open(project_path / 'README.md', 'r', encoding='utf-8', errors='ignore') as f:
                     readme_content = f.read().lower()
@@ -4215,13 +4700,13 @@ edition = "2021"
         
         # Check for language-specific directories (good organization)
         lang_dirs = ['src', 'lib', 'app', 'frontend', 'backend', 'api', 'scripts']
-        has_organized_dirs = any((project_path / lang_dir).exists() for lang_dir in lang_dirs)
+        has_organized_dirs = not names.isdisjoint(lang_dirs)
         if has_organized_dirs:
             integration_score += 1
         
         # Check for configuration files that might coordinate languages
         config_files = ['config.json', 'config.yaml', 'config.yml', 'settings.json']
-        has_config = any((project_path / config_file).exists() for config_file in config_files)
+        has_config = not names.isdisjoint(config_files)
         if has_config:
             integration_score += 1
         
@@ -4433,42 +4918,45 @@ export SCRIPT_DIR LOG_DIR TEMP_DIR
         
         self.monitoring_running = True
         self.monitoring_status_var.set("Running")
-        self.monitoring_thread = threading.Thread(target=self.monitor_projects)
-        self.monitoring_thread.daemon = True
-        self.monitoring_thread.start()
+        self.monitor_projects()
     
     def stop_monitoring(self):
         """Stop project monitoring"""
         self.monitoring_running = False
+        if self.monitoring_after_id is not None:
+            self.root.after_cancel(self.monitoring_after_id)
+            self.monitoring_after_id = None
         self.monitoring_status_var.set("Stopped")
     
     def monitor_projects(self):
-        """Monitor project health"""
-        while self.monitoring_running:
-            try:
-                # Check project health
-                issues = []
-                for project in self.projects:
-                    if project['health'] < self.health_threshold_var.get():
-                        issues.append(f"{project['name']}: Health score {project['health']}%")
-                
-                # Update monitoring text
-                if issues:
-                    self.monitoring_text.delete(1.0, tk.END)
-                    self.monitoring_text.insert(1.0, f"Monitoring Results - {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                    for issue in issues:
-                        self.monitoring_text.insert(tk.END, f"⚠️ {issue}\n")
-                else:
-                    self.monitoring_text.delete(1.0, tk.END)
-                    self.monitoring_text.insert(1.0, f"Monitoring Results - {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                    self.monitoring_text.insert(tk.END, "✅ All projects are healthy!\n")
-                
-                # Wait for next check
-                time.sleep(self.config["monitoring"]["check_interval"])
-                
-            except Exception as e:
-                print(f"Error in monitoring: {e}")
-                break
+        """Check project health once, then schedule the next check on the Tk event loop"""
+        self.monitoring_after_id = None
+        if not self.monitoring_running:
+            return
+        
+        try:
+            # Check project health against a single snapshot of the threshold
+            threshold = self.health_threshold_var.get()
+            issues = [f"{project['name']}: Health score {project['health']}%"
+                      for project in self.projects if project['health'] < threshold]
+            
+            # Update monitoring text
+            self.monitoring_text.delete(1.0, tk.END)
+            self.monitoring_text.insert(1.0, f"Monitoring Results - {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            if issues:
+                for issue in issues:
+                    self.monitoring_text.insert(tk.END, f"⚠️ {issue}\n")
+            else:
+                self.monitoring_text.insert(tk.END, "✅ All projects are healthy!\n")
+            
+            # Wait for next check
+            interval_ms = int(self.config["monitoring"]["check_interval"] * 1000)
+            self.monitoring_after_id = self.root.after(interval_ms, self.monitor_projects)
+            
+        except Exception as e:
+            print(f"Error in monitoring: {e}")
+            self.monitoring_running = False
+            self.monitoring_status_var.set("Stopped")
     
     def browse_projects_dir(self):
         """Browse for projects directory"""
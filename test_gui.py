@@ -61,5 +61,5 @@ try:
 except ImportError as e:
     print(f"[ERROR] Import error: {e}")
     print("Make sure all required packages are installed:")
-    print("pip install psutil requests")
+    print("pip install -r requirements.txt")
     sys.exit(1)